@@ -1,10 +1,102 @@
 from __future__ import annotations
 
+import io
 import os
+import queue
 import re
 import subprocess
+import sys
 import threading
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future
+from typing import Any, Protocol, cast
+
+try:
+    import re2 as _regex
+except ImportError:  # optional DFA-based engine; fall back to the stdlib
+    _regex = re
+
+
+class _Pattern(Protocol):
+    """Compiled-regex interface shared by ``re`` and ``re2`` patterns."""
+
+    def sub(self, repl: str, string: str) -> str: ...
+
+
+# ECMA-48 CSI sequences (colors, cursor/erase moves, keys like ESC [2~), OSC
+# strings (window titles, hyperlinks) ended by BEL or ST, and two-byte escapes
+# (ESC c, ESC 7); progress/spinner crates emit all of them
+_ANSI_RE: _Pattern = _regex.compile(
+    r"\x1B(?:\[[0-?]*[ -/]*[@-~]|\][^\x07\x1B]*(?:\x07|\x1B\\)|[0-~])"
+)
+
+# Maximum bytes pulled from the process pipe per read
+_CHUNK_SIZE = 65536
+
+# A windowed GUI has no console to share, so without CREATE_NO_WINDOW every
+# console child (hemtt, winget) would get its own conhost window
+if sys.platform == "win32":
+    _CREATION_FLAGS = subprocess.CREATE_NO_WINDOW
+else:
+    _CREATION_FLAGS = 0
+
+# A pool job: its future, the callable and the callable's arguments
+_Job = tuple[Future[None], Callable[..., None], tuple[Any, ...]]
+
+
+class _DaemonPool:
+    """Shared, growable pool of daemon worker threads.
+
+    Unlike ``ThreadPoolExecutor`` workers, daemon threads are not joined at
+    interpreter exit, so a read blocked on a pipe inherited by a grandchild
+    process cannot hold up closing the app. A worker is only started when
+    every existing one is busy, so a blocked job never starves another.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._jobs: queue.SimpleQueue[_Job] = queue.SimpleQueue()
+        self._idle = threading.Semaphore(0)
+        self._lock = threading.Lock()
+        self._count = 0
+
+    def submit(self, fn: Callable[..., None], *args: Any) -> Future[None]:
+        """Schedule ``fn(*args)`` on an idle worker, or a new one if none is idle."""
+        future: Future[None] = Future()
+        self._jobs.put((future, fn, args))
+        if not self._idle.acquire(blocking=False):
+            with self._lock:
+                self._count += 1
+                name = f"{self._name}_{self._count}"
+            threading.Thread(target=self._work, name=name, daemon=True).start()
+        return future
+
+    def _work(self) -> None:
+        """Run queued jobs forever, reporting each outcome on its future."""
+        while True:
+            future, fn, args = self._jobs.get()
+            if not future.set_running_or_notify_cancel():
+                self._idle.release()
+                continue
+            error: BaseException | None = None
+            try:
+                fn(*args)
+            except BaseException as exc:
+                error = exc
+            # Count as idle before publishing the outcome, so a caller that
+            # waits on the future and then submits again reuses this worker
+            self._idle.release()
+            if error is None:
+                future.set_result(None)
+            else:
+                future.set_exception(error)
+
+
+# Shared worker threads, reused across runs. Readers and output processors
+# live in separate pools so each pool's threads only ever wait on one kind
+# of job.
+_RUNNER_POOL = _DaemonPool("cmdrunner")
+_OUTPUT_POOL = _DaemonPool("cmdoutput")
 
 
 def strip_ansi_codes(text: str) -> str:
@@ -20,18 +112,20 @@ def strip_ansi_codes(text: str) -> str:
     str
         Cleaned line without escape sequences.
     """
-    ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-    return ansi_escape.sub("", text)
+    # NO_COLOR/TERM=dumb means most lines carry no escape byte at all
+    if "\x1b" not in text:
+        return text
+    return _ANSI_RE.sub("", text)
 
 
-def build_command(hemtt_executable: str, args: list[str]) -> list[str]:
+def build_command(hemtt_executable: str, args: Sequence[str]) -> list[str]:
     """Construct the argv list for invoking HEMTT.
 
     Parameters
     ----------
     hemtt_executable: str
         Path or name of the hemtt executable.
-    args: list[str]
+    args: Sequence[str]
         Positional arguments to pass to hemtt.
 
     Returns
@@ -39,9 +133,7 @@ def build_command(hemtt_executable: str, args: list[str]) -> list[str]:
     list[str]
         The full command suitable for subprocess APIs.
     """
-    cmd = [hemtt_executable]
-    cmd.extend(args)
-    return cmd
+    return [hemtt_executable, *args]
 
 
 class CommandRunner:
@@ -62,7 +154,8 @@ class CommandRunner:
         cwd: Optional[str]
             Working directory for the process.
         on_output: Callable[[str], None] | None
-            Callback invoked for each line of stdout/stderr merged stream.
+            Callback invoked with batches of the merged stdout/stderr stream.
+            Each call may carry several newline-terminated lines.
         on_exit: Callable[[int], None] | None
             Callback invoked once process finishes with its return code.
         env: Optional[dict[str, str]]
@@ -74,22 +167,25 @@ class CommandRunner:
         self.on_exit = on_exit or (lambda _code: None)
         self.env = env
 
-        self.process: subprocess.Popen[str] | None = None
-        self._thread: threading.Thread | None = None
+        self.process: subprocess.Popen[bytes] | None = None
+        self._future: Future[None] | None = None
         self._cancel_requested = False
         self.is_running = False
 
     def start(self) -> None:
-        """Start the command runner in a background thread."""
-        if self.is_running:
+        """Start the command runner on the shared background worker pool."""
+        if self.is_running or (self._future is not None and not self._future.done()):
             return
         self._cancel_requested = False
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+        self._future = _RUNNER_POOL.submit(self._run)
 
     def cancel(self) -> None:
         """Cancel the running process by terminating or killing it."""
         self._cancel_requested = True
+        if self._future is not None and self._future.cancel():
+            # Never reached a worker, so no process was spawned
+            self.on_exit(1)
+            return
         if self.process and self.is_running:
             try:
                 self.process.terminate()
@@ -99,38 +195,92 @@ class CommandRunner:
                 except Exception:
                     pass
 
+    def _emit(self, text: str) -> None:
+        """Normalize newlines, strip ANSI codes and deliver a block of output lines."""
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+        self.on_output(strip_ansi_codes(text))
+
+    def _drain(self, stream: io.BufferedReader, chunks: queue.SimpleQueue[bytes | None]) -> None:
+        """Read the pipe in large chunks and hand them to the processing worker.
+
+        Only raw reads happen here so the pipe keeps draining even when
+        ``on_output`` is slow. A ``None`` sentinel marks the end of output.
+
+        Parameters
+        ----------
+        stream: io.BufferedReader
+            Buffered binary pipe connected to the process output.
+        chunks: queue.SimpleQueue[bytes | None]
+            Queue shared with :meth:`_process`.
+        """
+        # read1 returns whatever is available instead of waiting for a full chunk
+        read, put = stream.read1, chunks.put
+        try:
+            while not self._cancel_requested:
+                chunk = read(_CHUNK_SIZE)
+                if not chunk:
+                    break
+                put(chunk)
+        finally:
+            chunks.put(None)
+
+    def _process(self, chunks: queue.SimpleQueue[bytes | None]) -> None:
+        """Split queued chunks into lines and emit them once per chunk.
+
+        Both ``\\n`` and a bare ``\\r`` (progress/spinner output) end a line.
+
+        Parameters
+        ----------
+        chunks: queue.SimpleQueue[bytes | None]
+            Queue filled by :meth:`_drain`; ``None`` ends processing.
+        """
+        get, emit = chunks.get, self._emit
+        # Unterminated tail, kept as pieces so a long line isn't re-copied per read
+        pending: list[bytes] = []
+        while (chunk := get()) is not None:
+            # CR and LF never occur inside a UTF-8 sequence, so decoding up to
+            # either cannot split a character. A CR in the last byte may be the
+            # first half of a CRLF pair and stays pending until the next read.
+            cut = max(chunk.rfind(b"\n"), chunk.rfind(b"\r", 0, len(chunk) - 1)) + 1
+            if cut:
+                pending.append(chunk[:cut])
+                emit(b"".join(pending).decode("utf-8", errors="replace"))
+                pending = [chunk[cut:]] if cut < len(chunk) else []
+            elif pending and pending[-1].endswith(b"\r"):
+                # The held CR was not followed by LF, so it ended a line
+                emit(b"".join(pending).decode("utf-8", errors="replace"))
+                pending = [chunk]
+            else:
+                pending.append(chunk)
+        if pending:
+            emit(b"".join(pending).decode("utf-8", errors="replace"))
+
     def _run(self) -> None:
         """Internal method to execute the command in a subprocess."""
         self.is_running = True
         try:
-            # Prepare environment to disable color output from HEMTT
-            run_env = self.env.copy() if self.env else os.environ.copy()
-            # Force NO_COLOR to disable ANSI color codes
-            run_env["NO_COLOR"] = "1"
-            # Also set other common env vars that disable colors
-            run_env["TERM"] = "dumb"
-
-            # Use universal_newlines/text True for str output with UTF-8 encoding
+            # Prepare environment with NO_COLOR/TERM=dumb to disable ANSI colors
+            run_env = {**(self.env or os.environ), "NO_COLOR": "1", "TERM": "dumb"}
+
+            # Binary, block-buffered pipe; decoding happens per chunk below
             self.process = subprocess.Popen(
                 self.command,
                 cwd=self.cwd or None,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True,
-                encoding="utf-8",
-                errors="replace",
+                bufsize=-1,
                 env=run_env,
+                creationflags=_CREATION_FLAGS,
             )
+            if self._cancel_requested:
+                # cancel() ran before there was a process to terminate
+                self.process.terminate()
             assert self.process.stdout is not None
+            chunks: queue.SimpleQueue[bytes | None] = queue.SimpleQueue()
+            worker = _OUTPUT_POOL.submit(self._process, chunks)
             with self.process.stdout:
-                for line in self.process.stdout:
-                    # Strip ANSI escape codes before sending to output
-                    clean_line = strip_ansi_codes(line)
-                    self.on_output(clean_line)
-                    if self._cancel_requested:
-                        break
+                self._drain(cast(io.BufferedReader, self.process.stdout), chunks)
+            worker.result()
             # Ensure process completed
             returncode = self.process.wait()
             self.on_exit(returncode)
@@ -1,25 +1,51 @@
 from __future__ import annotations
 
+import copy
 import json
 import os
-from typing import Any
+from types import ModuleType
+from typing import Any, cast
+
+orjson: ModuleType | None
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib codec
+    orjson = None
 
 DEFAULTS: dict[str, Any] = {
     "hemtt_path": "hemtt",
     "project_dir": os.getcwd(),
     # UI preferences
     "dark_mode": False,
+    # Last directory of each file dialog, keyed by dialog title
+    "last_dirs": {},
     # Option toggles
     "verbose": False,
     "pedantic": False,
 }
 
 
+# Store alongside the app by default for simplicity
+_CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.json")
+
+
+def _loads(raw: bytes) -> Any:
+    """Decode JSON bytes with orjson when available, else the stdlib."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(data: dict[str, Any]) -> bytes:
+    """Encode a config dictionary as indented JSON bytes."""
+    if orjson is not None:
+        return cast(bytes, orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
 def get_config_path() -> str:
     """Return the absolute path to the local configuration JSON file."""
-    # Store alongside the app by default for simplicity
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    return os.path.join(base_dir, "config.json")
+    return _CONFIG_PATH
 
 
 def load_config() -> dict[str, Any]:
@@ -31,27 +57,30 @@ def load_config() -> dict[str, Any]:
         A dictionary containing configuration values merged with DEFAULTS.
     """
     path = get_config_path()
-    if not os.path.isfile(path):
-        return DEFAULTS.copy()
     try:
-        with open(path, encoding="utf-8") as f:
-            data = json.load(f)
+        # A missing file raises FileNotFoundError and falls back to defaults
+        with open(path, "rb") as f:
+            data = _loads(f.read())
             if not isinstance(data, dict):
-                return DEFAULTS.copy()
-            # fill defaults
-            cfg = DEFAULTS.copy()
+                return copy.deepcopy(DEFAULTS)
+            # fill defaults; deep copy so nested defaults like last_dirs are never shared
+            cfg = copy.deepcopy(DEFAULTS)
             cfg.update({k: v for k, v in data.items() if isinstance(k, str)})
             return cfg
     except Exception:
-        return DEFAULTS.copy()
+        return copy.deepcopy(DEFAULTS)
 
 
 def save_config(data: dict[str, Any]) -> None:
     """Persist the provided configuration dictionary to disk as JSON."""
     path = get_config_path()
+    tmp_path = path + ".tmp"
     try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        payload = _dumps(data)
+        # Write the whole payload to a temp file, then swap it in atomically
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
     except Exception:
         # Best effort only
         pass
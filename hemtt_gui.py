@@ -1,14 +1,24 @@
 import os
-import queue
+import re
 import shlex
 import shutil
 import subprocess
 import sys
 import time
-import webbrowser
-
-from PySide6.QtCore import QTimer
-from PySide6.QtGui import QColor, QDragEnterEvent, QDropEvent, QPalette
+from collections.abc import Callable, Sequence
+from functools import lru_cache, partial
+from operator import attrgetter
+from typing import cast
+
+from PySide6.QtCore import QTimer, Signal, Slot
+from PySide6.QtGui import (
+    QColor,
+    QDragEnterEvent,
+    QDropEvent,
+    QFont,
+    QPalette,
+    QTextCharFormat,
+)
 from PySide6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -16,16 +26,16 @@ from PySide6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
     QFileDialog,
+    QFormLayout,
     QFrame,
     QGridLayout,
-    QGroupBox,
     QHBoxLayout,
     QLabel,
+    QLayout,
     QLineEdit,
     QMainWindow,
     QMessageBox,
     QPushButton,
-    QRadioButton,
     QSpinBox,
     QTextEdit,
     QVBoxLayout,
@@ -37,6 +47,151 @@ from config_store import load_config, save_config
 
 APP_TITLE = "GUI 4 HEMTT"
 
+# Oldest output lines are dropped beyond this many to bound log memory
+_OUTPUT_MAX_LINES = 5000
+
+# Dark theme for command dialogs, installed application-wide with the
+# main window's button sheet so it is parsed once per theme switch
+_DIALOG_DARK_QSS = """
+    BaseCommandDialog { background-color: #2b2b2b; color: #e0e0e0; }
+    BaseCommandDialog QLabel { color: #e0e0e0; }
+    BaseCommandDialog QCheckBox { color: #e0e0e0; }
+    BaseCommandDialog QLineEdit { background-color: #3b3b3b; color: #e0e0e0; border: 1px solid #555; border-radius: 3px; padding: 4px; }
+    BaseCommandDialog QComboBox { background-color: #3b3b3b; color: #e0e0e0; border: 1px solid #555; border-radius: 3px; padding: 4px; }
+    BaseCommandDialog QSpinBox { background-color: #3b3b3b; color: #e0e0e0; border: 1px solid #555; border-radius: 3px; padding: 4px; }
+"""
+
+# Thread count HEMTT picks on its own; dialogs only pass -t when it differs
+_DEFAULT_THREADS = os.cpu_count() or 4
+
+# Shared verbosity argument tuples; callers only ever extend() with them
+_VERBOSITY_NORMAL: tuple[str, ...] = ()
+_VERBOSITY_DEBUG = ("-v",)
+_VERBOSITY_TRACE = ("-vv",)
+_VERBOSITY_ARGS = (_VERBOSITY_NORMAL, _VERBOSITY_DEBUG, _VERBOSITY_TRACE)  # By combo index
+
+# Monospace font for the output log
+_MONO_FONT = QFont("Consolas", 10)
+
+# Output highlighting keywords per severity, highest priority first
+_SEVERITY_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "error": ("error", "err:", "fatal", "failed", "failure"),
+    "warning": ("warning", "warn:", "caution"),
+    "info": ("info", "information", "note:", "hint:"),
+}
+_SEVERITY_LEVEL = {kw: level for level, kws in _SEVERITY_KEYWORDS.items() for kw in kws}
+_SEVERITY_RANK = {level: rank for rank, level in enumerate(_SEVERITY_KEYWORDS)}
+_SEVERITY_RE = re.compile("|".join(map(re.escape, _SEVERITY_LEVEL)), re.IGNORECASE)
+
+
+def _severity_level(text: str) -> str | None:
+    """Return the severity level of a line for highlighting, if any."""
+    # One regex pass; the highest-priority keyword anywhere in the line wins
+    level = None
+    for match in _SEVERITY_RE.finditer(text):
+        found = _SEVERITY_LEVEL[match.group().lower()]
+        if level is None or _SEVERITY_RANK[found] < _SEVERITY_RANK[level]:
+            level = found
+            if found == "error":
+                break
+    return level
+
+
+def _classify_output(text: str) -> list[tuple[str | None, str]]:
+    """Split output into runs of consecutive lines sharing a severity level.
+
+    Parameters
+    ----------
+    text: str
+        One or more lines of command output.
+
+    Returns
+    -------
+    list[tuple[str | None, str]]
+        ``(level, text)`` pairs; every line in ``text`` ends with a newline.
+    """
+    runs: list[tuple[str | None, str]] = []
+    run: list[str] = []
+    run_level = None
+    for line in text.splitlines(keepends=True):
+        # Ensure each line ends with newline if not already present
+        if not line.endswith("\n"):
+            line += "\n"
+        level = _severity_level(line)
+        if run and level != run_level:
+            runs.append((run_level, "".join(run)))
+            run = []
+        run_level = level
+        run.append(line)
+    if run:
+        runs.append((run_level, "".join(run)))
+    return runs
+
+
+def _add_widgets(layout: QLayout, *widgets: QWidget) -> None:
+    """Add several widgets to a layout in order."""
+    add = layout.addWidget
+    for widget in widgets:
+        add(widget)
+
+
+@lru_cache(maxsize=64)
+def _split_tokens(text: str) -> tuple[str, ...]:
+    """Split a text entry into whitespace-separated tokens, memoized per string."""
+    return tuple(text.split())
+
+
+def _parent_dir(path: str) -> str:
+    """Return the directory containing ``path``, resolving it only when relative."""
+    # File dialogs already return absolute paths
+    return os.path.dirname(path if os.path.isabs(path) else os.path.abspath(path))
+
+
+def _path_key(path: str) -> str:
+    """Return ``path`` in a comparable form; string-only, so cheap on the GUI thread."""
+    # Drops normalize trailing/duplicate separators and, on Windows, case
+    return os.path.normcase(os.path.normpath(path))
+
+
+# Standard buttons of every command dialog
+_OK_CANCEL = QDialogButtonBox.Ok | QDialogButtonBox.Cancel
+
+# --format choices shared by HEMTT's inspect/coverage commands; ascii is the default
+_OUTPUT_FORMATS = ("ascii", "json", "pretty-json", "markdown")
+
+# Arguments of the commands that run without options
+_CMD_UTILS_FNL = ("utils", "fnl")
+_CMD_UTILS_BOM = ("utils", "bom")
+_CMD_WIKI_FORCE_PULL = ("wiki", "force-pull")
+_CMD_AUDIO_COMPRESS = ("utils", "audio", "compress")
+
+# Tooltips for dialog checkboxes, keyed by the HEMTT flag they toggle
+_TOOLTIPS: dict[str, str] = {
+    "-p": "Enable all lints that are disabled by default",
+    "-e": "Treat all help and warning messages as errors",
+    "-b": "Use BI's binarize on supported files",
+    "--no-rap": "Do not rapify (cpp, rvmat, ext, sqm, bikb, bisurf)",
+    "-O": "Include all optional addon folders",
+    "--no-bin": "Do not binarize the project",
+    "--no-sign": "Do not sign the PBOs or create a bikey",
+    "--no-archive": "Do not create a zip archive of the release",
+    "-Q": "Skip build step, launch last built version",
+    "-F": "Disable file patching",
+    "--only-lang": "Only sort the languages within keys, preserve order of packages/containers/keys",
+}
+
+
+def _flag_checkbox(text: str, flag: str) -> QCheckBox:
+    """Create a dialog checkbox for ``flag`` with its shared tooltip."""
+    check = QCheckBox(text)
+    check.setToolTip(_TOOLTIPS[flag])
+    return check
+
+
+def _spec_getters(spec: tuple[tuple[str, str], ...]) -> tuple[tuple[attrgetter, str], ...]:
+    """Turn an ``(attribute, flag)`` spec into ``(attrgetter, flag)`` pairs."""
+    return tuple((attrgetter(name), flag) for name, flag in spec)
+
 
 class HemttGUI(QMainWindow):
     """PySide6-based GUI wrapper around the HEMTT CLI.
@@ -45,6 +200,86 @@ class HemttGUI(QMainWindow):
     preferences such as dark mode and verbosity toggles.
     """
 
+    # Emitted from runner threads; Qt queues delivery onto the GUI thread
+    output_received = Signal(object)  # list of (severity, text) runs
+    # object, not int: Windows exit codes such as HRESULTs exceed a C int
+    command_finished = Signal(object)
+
+    # Application-wide button sheet; the QPushButton selector reaches every button
+    _LIGHT_QSS = """
+        QPushButton {
+            border: 1px solid #888;
+            border-radius: 4px;
+            padding: 5px 15px;
+            background-color: #f0f0f0;
+        }
+        QPushButton:hover {
+            background-color: #e0e0e0;
+            border: 1px solid #666;
+        }
+        QPushButton:pressed {
+            background-color: #d0d0d0;
+        }
+        QPushButton:disabled {
+            background-color: #f5f5f5;
+            color: #999;
+            border: 1px solid #ccc;
+        }
+    """
+
+    _DARK_QSS = """
+        QPushButton {
+            border: 1px solid #555;
+            border-radius: 4px;
+            padding: 5px 15px;
+            background-color: #3a3a3a;
+            color: #e0e0e0;
+        }
+        QPushButton:hover {
+            background-color: #4a4a4a;
+            border: 1px solid #666;
+        }
+        QPushButton:pressed {
+            background-color: #2a2a2a;
+        }
+        QPushButton:disabled {
+            background-color: #2f2f2f;
+            color: #666;
+            border: 1px solid #444;
+        }
+    """
+
+    # Widget-level sheets for collapsible section headers
+    _LIGHT_HEADER_QSS = """
+        QPushButton {
+            border: none;
+            border-bottom: 1px solid #bbb;
+            border-radius: 0px;
+            padding: 3px 8px;
+            background-color: #e4e4e4;
+            color: #333;
+            text-align: left;
+            font-weight: bold;
+        }
+        QPushButton:hover { background-color: #d8d8d8; }
+        QPushButton:checked { background-color: #d8d8d8; }
+    """
+
+    _DARK_HEADER_QSS = """
+        QPushButton {
+            border: none;
+            border-bottom: 1px solid #555;
+            border-radius: 0px;
+            padding: 3px 8px;
+            background-color: #2a2a2a;
+            color: #c0c0c0;
+            text-align: left;
+            font-weight: bold;
+        }
+        QPushButton:hover { background-color: #353535; }
+        QPushButton:checked { background-color: #353535; color: #e0e0e0; }
+    """
+
     def __init__(self):
         """Initialize the main application window and state."""
         super().__init__()
@@ -53,12 +288,19 @@ class HemttGUI(QMainWindow):
         self.setAcceptDrops(True)
 
         # State
-        self.output_queue: queue.Queue[str] = queue.Queue()
         self.runner: CommandRunner | None = None
         self.running: bool = False
         self.start_time: float = 0.0
         self.dark_mode: bool = False
         self.current_theme: dict = {}  # Will be set by theme setup
+        # Character format per severity level (None = uncoloured)
+        self._severity_formats: dict[str | None, QTextCharFormat] = {}
+        self._cwd: str = os.getcwd()  # Fallback directory, resolved once
+        self._which_cache: dict[str, str] = {}  # Successful PATH lookups by name
+        self._file_dialogs: dict[str, QFileDialog] = {}  # Browse dialogs by title
+        self._dialog_cache: dict[type, BaseCommandDialog] = {}  # Command dialogs by class
+        self._saved_config: dict | None = None  # Last settings written to disk
+        self._last_dirs: dict[str, str] = {}  # Start directory per file dialog title
 
         # Load config
         self.config_data = load_config()
@@ -67,10 +309,19 @@ class HemttGUI(QMainWindow):
         self._build_ui()
         self._load_config_into_ui()
 
-        # Setup timer for polling output queue
-        self.poll_timer = QTimer()
-        self.poll_timer.timeout.connect(self._poll_output_queue)
-        self.poll_timer.start(100)  # Poll every 100ms
+        # Runner output arrives via signals instead of a polled queue
+        self.output_received.connect(self._on_output)
+        self.command_finished.connect(self._on_command_exit)
+
+        # Elapsed-time ticker, only active while a command runs
+        self.elapsed_timer = QTimer(self)
+        self.elapsed_timer.timeout.connect(self._update_elapsed)
+
+        # Coalesces bursts of setting changes into a single config write
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(250)
+        self._save_timer.timeout.connect(self._write_config)
 
     def dragEnterEvent(self, event: QDragEnterEvent) -> None:
         """Accept drag events with file URLs."""
@@ -83,16 +334,15 @@ class HemttGUI(QMainWindow):
             urls = event.mimeData().urls()
             if urls:
                 path = urls[0].toLocalFile()
-                # Check if it's a directory
-                if os.path.isdir(path):
+                # If file was dropped, use its parent directory
+                if not os.path.isdir(path):
+                    path = os.path.dirname(path)
+                    if not os.path.isdir(path):
+                        return
+                # Re-dropping the current project changes nothing
+                if _path_key(path) != _path_key(self.proj_entry.text()):
                     self.proj_entry.setText(path)
                     self._persist_config()
-                else:
-                    # If file was dropped, use its parent directory
-                    parent_dir = os.path.dirname(path)
-                    if os.path.isdir(parent_dir):
-                        self.proj_entry.setText(parent_dir)
-                        self._persist_config()
 
     def _build_ui(self) -> None:
         """Create and lay out all UI widgets."""
@@ -102,103 +352,23 @@ class HemttGUI(QMainWindow):
         main_layout = QVBoxLayout(central_widget)
         main_layout.setContentsMargins(8, 8, 8, 8)
 
-        # Set button styling for better visibility
-        self.light_button_style = """
-            QPushButton {
-                border: 1px solid #888;
-                border-radius: 4px;
-                padding: 5px 15px;
-                background-color: #f0f0f0;
-            }
-            QPushButton:hover {
-                background-color: #e0e0e0;
-                border: 1px solid #666;
-            }
-            QPushButton:pressed {
-                background-color: #d0d0d0;
-            }
-            QPushButton:disabled {
-                background-color: #f5f5f5;
-                color: #999;
-                border: 1px solid #ccc;
-            }
-        """
-
-        self.dark_button_style = """
-            QPushButton {
-                border: 1px solid #555;
-                border-radius: 4px;
-                padding: 5px 15px;
-                background-color: #3a3a3a;
-                color: #e0e0e0;
-            }
-            QPushButton:hover {
-                background-color: #4a4a4a;
-                border: 1px solid #666;
-            }
-            QPushButton:pressed {
-                background-color: #2a2a2a;
-            }
-            QPushButton:disabled {
-                background-color: #2f2f2f;
-                color: #666;
-                border: 1px solid #444;
-            }
-        """
-
-        # Start with light mode style
-        self.button_style = self.light_button_style
-
-        self.light_header_style = """
-            QPushButton {
-                border: none;
-                border-bottom: 1px solid #bbb;
-                border-radius: 0px;
-                padding: 3px 8px;
-                background-color: #e4e4e4;
-                color: #333;
-                text-align: left;
-                font-weight: bold;
-            }
-            QPushButton:hover { background-color: #d8d8d8; }
-            QPushButton:checked { background-color: #d8d8d8; }
-        """
-
-        self.dark_header_style = """
-            QPushButton {
-                border: none;
-                border-bottom: 1px solid #555;
-                border-radius: 0px;
-                padding: 3px 8px;
-                background-color: #2a2a2a;
-                color: #c0c0c0;
-                text-align: left;
-                font-weight: bold;
-            }
-            QPushButton:hover { background-color: #353535; }
-            QPushButton:checked { background-color: #353535; color: #e0e0e0; }
-        """
-
-        self.header_style = self.light_header_style
+        self.header_style = self._LIGHT_HEADER_QSS
 
         # Winget install/update frame (top-most)
         winget_layout = QHBoxLayout()
-        self.btn_install_hemtt = QPushButton("Install HEMTT (winget)")
-        self.btn_install_hemtt.setStyleSheet(self.button_style)
-        self.btn_install_hemtt.setToolTip(
-            "Install HEMTT via Windows Package Manager\nRequires winget to be installed"
+        self.btn_install_hemtt = self._make_button(
+            "Install HEMTT (winget)",
+            self._install_hemtt,
+            "Install HEMTT via Windows Package Manager\nRequires winget to be installed",
         )
-        self.btn_install_hemtt.clicked.connect(self._install_hemtt)
 
-        self.btn_update_hemtt = QPushButton("Update HEMTT (winget)")
-        self.btn_update_hemtt.setStyleSheet(self.button_style)
-        self.btn_update_hemtt.setToolTip(
-            "Update HEMTT to latest version\nUses Windows Package Manager"
+        self.btn_update_hemtt = self._make_button(
+            "Update HEMTT (winget)",
+            self._update_hemtt,
+            "Update HEMTT to latest version\nUses Windows Package Manager",
         )
-        self.btn_update_hemtt.clicked.connect(self._update_hemtt)
 
-        winget_layout.addWidget(self.btn_install_hemtt)
-        winget_layout.addWidget(self.btn_update_hemtt)
+        _add_widgets(winget_layout, self.btn_install_hemtt, self.btn_update_hemtt)
         winget_layout.addStretch()
         main_layout.addLayout(winget_layout)
 
@@ -208,9 +378,8 @@ class HemttGUI(QMainWindow):
         # HEMTT executable path
         hemtt_label = QLabel("HEMTT executable:")
         self.hemtt_entry = QLineEdit()
-        self.hemtt_browse = QPushButton("Browse…")
-        self.hemtt_browse.setStyleSheet(self.button_style)
-        self.hemtt_browse.clicked.connect(self._browse_hemtt)
+        self.hemtt_entry.textChanged.connect(self._which_cache.clear)
+        self.hemtt_browse = self._make_button("Browse…", self._browse_hemtt)
         paths_grid.addWidget(hemtt_label, 0, 0)
         paths_grid.addWidget(self.hemtt_entry, 0, 1)
         paths_grid.addWidget(self.hemtt_browse, 0, 2)
@@ -218,9 +387,7 @@ class HemttGUI(QMainWindow):
         # Project directory
         proj_label = QLabel("Project directory:")
         self.proj_entry = QLineEdit()
-        self.proj_browse = QPushButton("Browse…")
-        self.proj_browse.setStyleSheet(self.button_style)
-        self.proj_browse.clicked.connect(self._browse_project)
+        self.proj_browse = self._make_button("Browse…", self._browse_project)
         paths_grid.addWidget(proj_label, 1, 0)
         paths_grid.addWidget(self.proj_entry, 1, 1)
         paths_grid.addWidget(self.proj_browse, 1, 2)
@@ -228,9 +395,7 @@ class HemttGUI(QMainWindow):
         # Arma 3 executable path
         arma3_label = QLabel("Arma 3 executable:")
         self.arma3_entry = QLineEdit()
-        self.arma3_browse = QPushButton("Browse…")
-        self.arma3_browse.setStyleSheet(self.button_style)
-        self.arma3_browse.clicked.connect(self._browse_arma3)
+        self.arma3_browse = self._make_button("Browse…", self._browse_arma3)
         paths_grid.addWidget(arma3_label, 2, 0)
         paths_grid.addWidget(self.arma3_entry, 2, 1)
         paths_grid.addWidget(self.arma3_browse, 2, 2)
@@ -253,45 +418,47 @@ class HemttGUI(QMainWindow):
         # Buttons frame - First row
         btns_layout = QHBoxLayout()
 
-        self.btn_check = QPushButton("hemtt check")
-        self.btn_check.setStyleSheet(self.button_style)
-        self.btn_check.setToolTip(
-            "Check project for errors\nQuick validation without building files"
+        self.btn_check = self._make_button(
+            "hemtt check",
+            partial(self._run_hemtt_dialog, CheckDialog, "check"),
+            "Check project for errors\nQuick validation without building files",
         )
-        self.btn_check.clicked.connect(self._run_check)
 
-        self.btn_dev = QPushButton("hemtt dev")
-        self.btn_dev.setStyleSheet(self.button_style)
-        self.btn_dev.setToolTip("Build for development\nCreates symlinks for file-patching")
-        self.btn_dev.clicked.connect(self._run_dev)
+        self.btn_dev = self._make_button(
+            "hemtt dev",
+            partial(self._run_hemtt_dialog, DevDialog, "dev"),
+            "Build for development\nCreates symlinks for file-patching",
+        )
 
-        self.btn_launch = QPushButton("hemtt launch")
-        self.btn_launch.setStyleSheet(self.button_style)
-        self.btn_launch.setToolTip(
-            "Build and launch Arma 3\nAutomatically loads mods and dependencies"
+        self.btn_launch = self._make_button(
+            "hemtt launch",
+            self._run_launch,
+            "Build and launch Arma 3\nAutomatically loads mods and dependencies",
         )
-        self.btn_launch.clicked.connect(self._run_launch)
 
-        self.btn_build = QPushButton("hemtt build")
-        self.btn_build.setStyleSheet(self.button_style)
-        self.btn_build.setToolTip("Build for local testing\nBinarizes files for final testing")
-        self.btn_build.clicked.connect(self._run_build)
+        self.btn_build = self._make_button(
+            "hemtt build",
+            partial(self._run_hemtt_dialog, BuildDialog, "build"),
+            "Build for local testing\nBinarizes files for final testing",
+        )
 
-        self.btn_release = QPushButton("hemtt release")
-        self.btn_release.setStyleSheet(self.button_style)
-        self.btn_release.setToolTip("Build for release\nCreates signed PBOs and archives")
-        self.btn_release.clicked.connect(self._run_release)
+        self.btn_release = self._make_button(
+            "hemtt release",
+            partial(self._run_hemtt_dialog, ReleaseDialog, "release"),
+            "Build for release\nCreates signed PBOs and archives",
+        )
 
-        self.btn_cancel = QPushButton("Cancel")
-        self.btn_cancel.setStyleSheet(self.button_style)
-        self.btn_cancel.clicked.connect(self._cancel_run)
+        self.btn_cancel = self._make_button("Cancel", self._cancel_run)
         self.btn_cancel.setEnabled(False)
 
-        btns_layout.addWidget(self.btn_check)
-        btns_layout.addWidget(self.btn_dev)
-        btns_layout.addWidget(self.btn_launch)
-        btns_layout.addWidget(self.btn_build)
-        btns_layout.addWidget(self.btn_release)
+        _add_widgets(
+            btns_layout,
+            self.btn_check,
+            self.btn_dev,
+            self.btn_launch,
+            self.btn_build,
+            self.btn_release,
+        )
 
         # Vertical separator
         v_separator = QFrame()
@@ -316,172 +483,177 @@ class HemttGUI(QMainWindow):
         # Buttons frame - Second row
         btns2_layout = QHBoxLayout()
 
-        self.btn_ln_sort = QPushButton("hemtt ln sort")
-        self.btn_ln_sort.setStyleSheet(self.button_style)
-        self.btn_ln_sort.setToolTip(
-            "Sort stringtable entries\nOrganizes localization keys alphabetically"
+        self.btn_ln_sort = self._make_button(
+            "hemtt ln sort",
+            partial(self._run_hemtt_dialog, LocalizationSortDialog),
+            "Sort stringtable entries\nOrganizes localization keys alphabetically",
+        )
+
+        self.btn_ln_coverage = self._make_button(
+            "hemtt ln coverage",
+            partial(self._run_hemtt_dialog, LocalizationCoverageDialog),
+            "Check stringtable coverage\nFinds missing translations",
         )
-        self.btn_ln_sort.clicked.connect(self._run_ln_sort)
 
-        self.btn_ln_coverage = QPushButton("hemtt ln coverage")
-        self.btn_ln_coverage.setStyleSheet(self.button_style)
-        self.btn_ln_coverage.setToolTip("Check stringtable coverage\nFinds missing translations")
-        self.btn_ln_coverage.clicked.connect(self._run_ln_coverage)
+        self.btn_utils_fnl = self._make_button(
+            "hemtt utils fnl",
+            partial(self._run, _CMD_UTILS_FNL),
+            "Insert final newline into files if missing\nEnsures files end with newline (POSIX standard)",
+        )
 
-        self.btn_utils_fnl = QPushButton("hemtt utils fnl")
-        self.btn_utils_fnl.setStyleSheet(self.button_style)
-        self.btn_utils_fnl.setToolTip(
-            "Insert final newline into files if missing\nEnsures files end with newline (POSIX standard)"
+        self.btn_utils_bom = self._make_button(
+            "hemtt utils bom",
+            partial(self._run, _CMD_UTILS_BOM),
+            "Remove UTF-8 BOM markers from files\nFixes parsing issues caused by Byte Order Marks",
         )
-        self.btn_utils_fnl.clicked.connect(self._run_utils_fnl)
 
-        self.btn_utils_bom = QPushButton("hemtt utils bom")
-        self.btn_utils_bom.setStyleSheet(self.button_style)
-        self.btn_utils_bom.setToolTip(
-            "Remove UTF-8 BOM markers from files\nFixes parsing issues caused by Byte Order Marks"
+        self.btn_book = self._make_button(
+            "hemtt book",
+            self._open_book,
+            "Open HEMTT documentation\nOpens hemtt.dev in your browser",
+        )
+
+        _add_widgets(
+            btns2_layout,
+            self.btn_ln_sort,
+            self.btn_ln_coverage,
+            self.btn_utils_fnl,
+            self.btn_utils_bom,
+            self.btn_book,
         )
-        self.btn_utils_bom.clicked.connect(self._run_utils_bom)
-
-        self.btn_book = QPushButton("hemtt book")
-        self.btn_book.setStyleSheet(self.button_style)
-        self.btn_book.setToolTip("Open HEMTT documentation\nOpens hemtt.dev in your browser")
-        self.btn_book.clicked.connect(self._open_book)
-
-        btns2_layout.addWidget(self.btn_ln_sort)
-        btns2_layout.addWidget(self.btn_ln_coverage)
-        btns2_layout.addWidget(self.btn_utils_fnl)
-        btns2_layout.addWidget(self.btn_utils_bom)
-        btns2_layout.addWidget(self.btn_book)
         btns2_layout.addStretch()
         main_layout.addLayout(btns2_layout)
 
         # Third row for PAA/PBO utility buttons
         btns3_layout = QHBoxLayout()
 
-        self.btn_paa_convert = QPushButton("hemtt paa convert")
-        self.btn_paa_convert.setStyleSheet(self.button_style)
-        self.btn_paa_convert.setToolTip(
-            "Convert image to/from PAA format\nSupports PNG, JPEG, BMP, etc."
+        self.btn_paa_convert = self._make_button(
+            "hemtt paa convert",
+            self._run_paa_convert,
+            "Convert image to/from PAA format\nSupports PNG, JPEG, BMP, etc.",
         )
-        self.btn_paa_convert.clicked.connect(self._run_paa_convert)
 
-        self.btn_paa_inspect = QPushButton("hemtt paa inspect")
-        self.btn_paa_inspect.setStyleSheet(self.button_style)
-        self.btn_paa_inspect.setToolTip(
-            "Inspect a PAA file\nShows PAA properties in various formats"
+        self.btn_paa_inspect = self._make_button(
+            "hemtt paa inspect",
+            partial(self._run_format_inspect, "PAA", "paa"),
+            "Inspect a PAA file\nShows PAA properties in various formats",
         )
-        self.btn_paa_inspect.clicked.connect(self._run_paa_inspect)
 
-        self.btn_pbo_inspect = QPushButton("hemtt pbo inspect")
-        self.btn_pbo_inspect.setStyleSheet(self.button_style)
-        self.btn_pbo_inspect.setToolTip(
-            "Inspect a PBO file\nShows PBO properties and contents in various formats"
+        self.btn_pbo_inspect = self._make_button(
+            "hemtt pbo inspect",
+            partial(self._run_format_inspect, "PBO", "pbo"),
+            "Inspect a PBO file\nShows PBO properties and contents in various formats",
         )
-        self.btn_pbo_inspect.clicked.connect(self._run_pbo_inspect)
 
-        self.btn_pbo_unpack = QPushButton("hemtt pbo unpack")
-        self.btn_pbo_unpack.setStyleSheet(self.button_style)
-        self.btn_pbo_unpack.setToolTip(
-            "Unpack a PBO file\nExtracts PBO contents with optional derapification"
+        self.btn_pbo_unpack = self._make_button(
+            "hemtt pbo unpack",
+            self._run_pbo_unpack,
+            "Unpack a PBO file\nExtracts PBO contents with optional derapification",
         )
-        self.btn_pbo_unpack.clicked.connect(self._run_pbo_unpack)
 
-        btns3_layout.addWidget(self.btn_paa_convert)
-        btns3_layout.addWidget(self.btn_paa_inspect)
-        btns3_layout.addWidget(self.btn_pbo_inspect)
-        btns3_layout.addWidget(self.btn_pbo_unpack)
+        _add_widgets(
+            btns3_layout,
+            self.btn_paa_convert,
+            self.btn_paa_inspect,
+            self.btn_pbo_inspect,
+            self.btn_pbo_unpack,
+        )
         btns3_layout.addStretch()
         main_layout.addLayout(btns3_layout)
 
         # Fourth row for additional utility buttons
         btns4_layout = QHBoxLayout()
 
-        self.btn_utils_inspect = QPushButton("hemtt utils inspect")
-        self.btn_utils_inspect.setStyleSheet(self.button_style)
-        self.btn_utils_inspect.setToolTip("Inspect an Arma file\nAuto-detects supported file types")
-        self.btn_utils_inspect.clicked.connect(self._run_utils_inspect)
+        self.btn_utils_inspect = self._make_button(
+            "hemtt utils inspect",
+            self._run_utils_inspect,
+            "Inspect an Arma file\nAuto-detects supported file types",
+        )
 
-        self.btn_utils_verify = QPushButton("hemtt utils verify")
-        self.btn_utils_verify.setStyleSheet(self.button_style)
-        self.btn_utils_verify.setToolTip(
-            "Verify a signed PBO against a public key\nRequires .pbo and .bikey"
+        self.btn_utils_verify = self._make_button(
+            "hemtt utils verify",
+            self._run_utils_verify,
+            "Verify a signed PBO against a public key\nRequires .pbo and .bikey",
         )
-        self.btn_utils_verify.clicked.connect(self._run_utils_verify)
 
-        self.btn_pbo_extract = QPushButton("hemtt pbo extract")
-        self.btn_pbo_extract.setStyleSheet(self.button_style)
-        self.btn_pbo_extract.setToolTip(
-            "Extract one file from a PBO\nSpecify the file path inside the archive"
+        self.btn_pbo_extract = self._make_button(
+            "hemtt pbo extract",
+            self._run_pbo_extract,
+            "Extract one file from a PBO\nSpecify the file path inside the archive",
         )
-        self.btn_pbo_extract.clicked.connect(self._run_pbo_extract)
 
-        self.btn_wiki_force_pull = QPushButton("hemtt wiki force-pull")
-        self.btn_wiki_force_pull.setStyleSheet(self.button_style)
-        self.btn_wiki_force_pull.setToolTip(
-            "Force pull the Arma 3 wiki cache\nRefreshes wiki data regardless of pull time"
+        self.btn_wiki_force_pull = self._make_button(
+            "hemtt wiki force-pull",
+            partial(self._run, _CMD_WIKI_FORCE_PULL),
+            "Force pull the Arma 3 wiki cache\nRefreshes wiki data regardless of pull time",
         )
-        self.btn_wiki_force_pull.clicked.connect(self._run_wiki_force_pull)
 
-        btns4_layout.addWidget(self.btn_utils_inspect)
-        btns4_layout.addWidget(self.btn_utils_verify)
-        btns4_layout.addWidget(self.btn_pbo_extract)
-        btns4_layout.addWidget(self.btn_wiki_force_pull)
+        _add_widgets(
+            btns4_layout,
+            self.btn_utils_inspect,
+            self.btn_utils_verify,
+            self.btn_pbo_extract,
+            self.btn_wiki_force_pull,
+        )
         btns4_layout.addStretch()
         main_layout.addLayout(btns4_layout)
 
         # Fifth row for audio/config utilities
         btns5_layout = QHBoxLayout()
 
-        self.btn_audio_inspect = QPushButton("hemtt audio inspect")
-        self.btn_audio_inspect.setStyleSheet(self.button_style)
-        self.btn_audio_inspect.setToolTip("Inspect audio metadata for WSS/WAV/OGG/MP3 files")
-        self.btn_audio_inspect.clicked.connect(self._run_audio_inspect)
-
-        self.btn_audio_convert = QPushButton("hemtt audio convert")
-        self.btn_audio_convert.setStyleSheet(self.button_style)
-        self.btn_audio_convert.setToolTip("Convert audio between WSS, WAV, OGG, and MP3")
-        self.btn_audio_convert.clicked.connect(self._run_audio_convert)
-
-        self.btn_audio_compress = QPushButton("hemtt audio compress")
-        self.btn_audio_compress.setStyleSheet(self.button_style)
-        self.btn_audio_compress.setToolTip("Check project for WSS files that can be compressed")
-        self.btn_audio_compress.clicked.connect(self._run_audio_compress)
-
-        self.btn_config_inspect = QPushButton("hemtt config inspect")
-        self.btn_config_inspect.setStyleSheet(self.button_style)
-        self.btn_config_inspect.setToolTip("Inspect an Arma config file")
-        self.btn_config_inspect.clicked.connect(self._run_config_inspect)
-
-        self.btn_config_derapify = QPushButton("hemtt config derapify")
-        self.btn_config_derapify.setStyleSheet(self.button_style)
-        self.btn_config_derapify.setToolTip("Derapify config.bin files to cpp/json")
-        self.btn_config_derapify.clicked.connect(self._run_config_derapify)
-
-        btns5_layout.addWidget(self.btn_audio_inspect)
-        btns5_layout.addWidget(self.btn_audio_convert)
-        btns5_layout.addWidget(self.btn_audio_compress)
-        btns5_layout.addWidget(self.btn_config_inspect)
-        btns5_layout.addWidget(self.btn_config_derapify)
+        self.btn_audio_inspect = self._make_button(
+            "hemtt audio inspect",
+            self._run_audio_inspect,
+            "Inspect audio metadata for WSS/WAV/OGG/MP3 files",
+        )
+
+        self.btn_audio_convert = self._make_button(
+            "hemtt audio convert",
+            self._run_audio_convert,
+            "Convert audio between WSS, WAV, OGG, and MP3",
+        )
+
+        self.btn_audio_compress = self._make_button(
+            "hemtt audio compress",
+            partial(self._run, _CMD_AUDIO_COMPRESS),
+            "Check project for WSS files that can be compressed",
+        )
+
+        self.btn_config_inspect = self._make_button(
+            "hemtt config inspect", self._run_config_inspect, "Inspect an Arma config file"
+        )
+
+        self.btn_config_derapify = self._make_button(
+            "hemtt config derapify",
+            self._run_config_derapify,
+            "Derapify config.bin files to cpp/json",
+        )
+
+        _add_widgets(
+            btns5_layout,
+            self.btn_audio_inspect,
+            self.btn_audio_convert,
+            self.btn_audio_compress,
+            self.btn_config_inspect,
+            self.btn_config_derapify,
+        )
         btns5_layout.addStretch()
         main_layout.addLayout(btns5_layout)
 
         # Sixth row for P3D and SQF utilities
         btns6_layout = QHBoxLayout()
 
-        self.btn_p3d_json = QPushButton("hemtt p3d json")
-        self.btn_p3d_json.setStyleSheet(self.button_style)
-        self.btn_p3d_json.setToolTip("Export a P3D model to JSON")
-        self.btn_p3d_json.clicked.connect(self._run_p3d_json)
+        self.btn_p3d_json = self._make_button(
+            "hemtt p3d json", self._run_p3d_json, "Export a P3D model to JSON"
+        )
 
-        self.btn_sqf_case = QPushButton("hemtt sqf case")
-        self.btn_sqf_case.setStyleSheet(self.button_style)
-        self.btn_sqf_case.setToolTip(
-            "Recursively fix SQF command casing\nReview changes carefully due possible false positives"
+        self.btn_sqf_case = self._make_button(
+            "hemtt sqf case",
+            self._run_sqf_case,
+            "Recursively fix SQF command casing\nReview changes carefully due possible false positives",
         )
-        self.btn_sqf_case.clicked.connect(self._run_sqf_case)
 
-        btns6_layout.addWidget(self.btn_p3d_json)
-        btns6_layout.addWidget(self.btn_sqf_case)
+        _add_widgets(btns6_layout, self.btn_p3d_json, self.btn_sqf_case)
         btns6_layout.addStretch()
         main_layout.addLayout(btns6_layout)
 
@@ -498,43 +670,45 @@ class HemttGUI(QMainWindow):
         # Project commands frame
         project_btns_layout = QHBoxLayout()
 
-        self.btn_new = QPushButton("hemtt new")
-        self.btn_new.setStyleSheet(self.button_style)
-        self.btn_new.setToolTip(
-            "Create a new HEMTT project\nInteractively sets up project structure"
+        self.btn_new = self._make_button(
+            "hemtt new",
+            self._run_new,
+            "Create a new HEMTT project\nInteractively sets up project structure",
+        )
+
+        self.btn_license = self._make_button(
+            "hemtt license",
+            self._run_license,
+            "Add or update license file\nChoose from available licenses",
+        )
+
+        self.btn_script = self._make_button(
+            "hemtt script", self._run_script, "Run a Rhai script\nExecute custom automation scripts"
+        )
+
+        self.btn_value = self._make_button(
+            "hemtt value",
+            self._run_value,
+            "Print config value\nRetrieve values from project configuration",
         )
-        self.btn_new.clicked.connect(self._run_new)
-
-        self.btn_license = QPushButton("hemtt license")
-        self.btn_license.setStyleSheet(self.button_style)
-        self.btn_license.setToolTip("Add or update license file\nChoose from available licenses")
-        self.btn_license.clicked.connect(self._run_license)
-
-        self.btn_script = QPushButton("hemtt script")
-        self.btn_script.setStyleSheet(self.button_style)
-        self.btn_script.setToolTip("Run a Rhai script\nExecute custom automation scripts")
-        self.btn_script.clicked.connect(self._run_script)
-
-        self.btn_value = QPushButton("hemtt value")
-        self.btn_value.setStyleSheet(self.button_style)
-        self.btn_value.setToolTip("Print config value\nRetrieve values from project configuration")
-        self.btn_value.clicked.connect(self._run_value)
-
-        self.btn_keys_generate = QPushButton("⚠️ hemtt keys generate")
-        self.btn_keys_generate.setStyleSheet(self.button_style)
-        self.btn_keys_generate.setToolTip(
+
+        self.btn_keys_generate = self._make_button(
+            "⚠️ hemtt keys generate",
+            self._run_keys_generate,
             "⚠️ Generate a new private key\n"
             "Create keys for signing PBOs\n\n"
             "WARNING: Keep private keys secure!\n"
-            "Never share or commit private keys to version control."
+            "Never share or commit private keys to version control.",
         )
-        self.btn_keys_generate.clicked.connect(self._run_keys_generate)
 
-        project_btns_layout.addWidget(self.btn_new)
-        project_btns_layout.addWidget(self.btn_license)
-        project_btns_layout.addWidget(self.btn_script)
-        project_btns_layout.addWidget(self.btn_value)
-        project_btns_layout.addWidget(self.btn_keys_generate)
+        _add_widgets(
+            project_btns_layout,
+            self.btn_new,
+            self.btn_license,
+            self.btn_script,
+            self.btn_value,
+            self.btn_keys_generate,
+        )
         project_btns_layout.addStretch()
         main_layout.addLayout(project_btns_layout)
 
@@ -552,9 +726,7 @@ class HemttGUI(QMainWindow):
         util_btns_layout = QHBoxLayout()
 
         # Dark mode toggle
-        self.btn_dark_mode = QPushButton("Toggle Dark Mode")
-        self.btn_dark_mode.setStyleSheet(self.button_style)
-        self.btn_dark_mode.clicked.connect(self._toggle_dark_mode)
+        self.btn_dark_mode = self._make_button("Toggle Dark Mode", self._toggle_dark_mode)
         util_btns_layout.addWidget(self.btn_dark_mode)
         util_btns_layout.addStretch()
         main_layout.addLayout(util_btns_layout)
@@ -564,20 +736,17 @@ class HemttGUI(QMainWindow):
         custom_layout.addWidget(QLabel("Custom args (after 'hemtt'):"))
         self.custom_entry = QLineEdit()
         custom_layout.addWidget(self.custom_entry, 1)
-        self.btn_custom = QPushButton("Run")
-        self.btn_custom.setStyleSheet(self.button_style)
-        self.btn_custom.clicked.connect(self._run_custom)
+        self.btn_custom = self._make_button("Run", self._run_custom)
         custom_layout.addWidget(self.btn_custom)
         main_layout.addLayout(custom_layout)
 
         # Output area
         self.output = QTextEdit()
         self.output.setReadOnly(True)
-        self.output.setFont(QApplication.font())  # Will be set to monospace later
-        font_mono = self.output.font()
-        font_mono.setFamily("Consolas")
-        font_mono.setPointSize(10)
-        self.output.setFont(font_mono)
+        self.output.setFont(_MONO_FONT)
+        self.output.document().setMaximumBlockCount(_OUTPUT_MAX_LINES)
+        # Read-only log: don't keep an undo record of every inserted chunk
+        self.output.setUndoRedoEnabled(False)
         main_layout.addWidget(self.output, 1)  # Stretch factor 1 to expand
 
         # Store initial colors for theme switching
@@ -592,6 +761,55 @@ class HemttGUI(QMainWindow):
         status_layout.addWidget(self.elapsed_label)
         main_layout.addLayout(status_layout)
 
+        # Widgets that start commands, disabled while one is running
+        self._run_widgets: tuple[QWidget, ...] = (
+            self.btn_build,
+            self.btn_release,
+            self.btn_check,
+            self.btn_dev,
+            self.btn_launch,
+            self.btn_utils_fnl,
+            self.btn_utils_bom,
+            self.btn_ln_sort,
+            self.btn_ln_coverage,
+            self.btn_paa_convert,
+            self.btn_paa_inspect,
+            self.btn_pbo_inspect,
+            self.btn_pbo_unpack,
+            self.btn_utils_inspect,
+            self.btn_utils_verify,
+            self.btn_pbo_extract,
+            self.btn_wiki_force_pull,
+            self.btn_audio_inspect,
+            self.btn_audio_convert,
+            self.btn_audio_compress,
+            self.btn_config_inspect,
+            self.btn_config_derapify,
+            self.btn_p3d_json,
+            self.btn_sqf_case,
+            self.btn_new,
+            self.btn_license,
+            self.btn_script,
+            self.btn_value,
+            self.btn_keys_generate,
+            self.btn_install_hemtt,
+            self.btn_update_hemtt,
+            self.btn_custom,
+            self.custom_entry,
+        )
+
+    def _make_button(self, text: str, slot: Callable[[], None], tooltip: str = "") -> QPushButton:
+        """Create a push button wired to ``slot``.
+
+        Styling comes from the application-wide button stylesheet, so nothing
+        is set on the widget itself.
+        """
+        button = QPushButton(text)
+        if tooltip:
+            button.setToolTip(tooltip)
+        button.clicked.connect(slot)
+        return button
+
     def _make_collapsible_section(self, title: str, buttons: list) -> QWidget:
         """Return a collapsible section widget with a toggle-header and a button row.
 
@@ -657,20 +875,25 @@ class HemttGUI(QMainWindow):
     def _load_config_into_ui(self) -> None:
         """Populate the UI from the persisted configuration file."""
         hemtt_path = self.config_data.get("hemtt_path") or "hemtt"
-        proj_dir = self.config_data.get("project_dir") or os.getcwd()
+        proj_dir = self.config_data.get("project_dir") or self._cwd
         arma3_path = self.config_data.get("arma3_executable") or ""
         self.hemtt_entry.setText(hemtt_path)
         self.proj_entry.setText(proj_dir)
         self.arma3_entry.setText(arma3_path)
+        last_dirs = self.config_data.get("last_dirs")
+        if isinstance(last_dirs, dict):
+            self._last_dirs.update(
+                (k, v) for k, v in last_dirs.items() if isinstance(v, str) and os.path.isdir(v)
+            )
 
     def _browse_hemtt(self) -> None:
         """Open a file dialog to select the HEMTT executable and persist path."""
-        initial = self.hemtt_entry.text() or os.getcwd()
-        path, _ = QFileDialog.getOpenFileName(
-            self,
+        initial = self.hemtt_entry.text()
+        path = self._choose_path(
             "Select HEMTT executable",
-            os.path.dirname(initial) if os.path.isfile(initial) else initial,
+            QFileDialog.FileMode.ExistingFile,
             "All files (*.*)",
+            os.path.dirname(initial) if os.path.isfile(initial) else initial,
         )
         if path:
             self.hemtt_entry.setText(path)
@@ -678,8 +901,9 @@ class HemttGUI(QMainWindow):
 
     def _browse_project(self) -> None:
         """Open a folder dialog to select the project directory and persist it."""
-        initial = self.proj_entry.text() or os.getcwd()
-        path = QFileDialog.getExistingDirectory(self, "Select project directory", initial)
+        path = self._choose_path(
+            "Select project directory", QFileDialog.FileMode.Directory, "", self.proj_entry.text()
+        )
         if path:
             self.proj_entry.setText(path)
             self._persist_config()
@@ -687,26 +911,103 @@ class HemttGUI(QMainWindow):
     def _browse_arma3(self) -> None:
         """Open a file dialog to select the Arma 3 executable and persist path."""
         initial = self.arma3_entry.text()
-        initialdir = (
-            os.path.dirname(initial) if initial and os.path.isfile(initial) else os.getcwd()
-        )
-        path, _ = QFileDialog.getOpenFileName(
-            self, "Select Arma 3 executable", initialdir, "Executable (*.exe);;All files (*.*)"
+        path = self._choose_path(
+            "Select Arma 3 executable",
+            QFileDialog.FileMode.ExistingFile,
+            "Executable (*.exe);;All files (*.*)",
+            os.path.dirname(initial) if os.path.isfile(initial) else "",
         )
         if path:
             self.arma3_entry.setText(path)
             self._persist_config()
 
+    def _choose_path(
+        self,
+        title: str,
+        mode: QFileDialog.FileMode,
+        name_filter: str = "",
+        directory: str = "",
+        save: bool = False,
+    ) -> str:
+        """Show a reusable file dialog and return the chosen path.
+
+        Dialogs are created on first use and cached per title, so their
+        file-system model stays warm between opens. The folder of each
+        choice is remembered per title and persisted in the config.
+
+        Parameters
+        ----------
+        title: str
+            Window title, also used as the cache and last-folder key.
+        mode: QFileDialog.FileMode
+            ``ExistingFile``, ``AnyFile`` (with ``save``) or ``Directory``.
+        name_filter: str
+            File type filters shown in the dialog, separated by ``;;``.
+        directory: str
+            Folder to open in; when it is not an existing directory the
+            dialog opens where it was last used.
+        save: bool
+            Ask for an output file, confirming before overwriting one.
+
+        Returns
+        -------
+        str
+            The selected path, or an empty string if the dialog was cancelled.
+        """
+        dialog = self._file_dialogs.get(title)
+        if dialog is None:
+            dialog = QFileDialog(self, title)
+            dialog.setFileMode(mode)
+            if save:
+                dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+            if mode == QFileDialog.FileMode.Directory:
+                dialog.setOption(QFileDialog.Option.ShowDirsOnly, True)
+            if name_filter:
+                dialog.setNameFilter(name_filter)
+            self._file_dialogs[title] = dialog
+        if not os.path.isdir(directory):
+            directory = self._last_dirs.get(title, self._cwd)
+        dialog.setDirectory(directory)
+        if not (dialog.exec() and dialog.selectedFiles()):
+            return ""
+        path = dialog.selectedFiles()[0]
+        folder = path if mode == QFileDialog.FileMode.Directory else os.path.dirname(path)
+        if self._last_dirs.get(title) != folder:
+            self._last_dirs[title] = folder
+            self._persist_config()
+        return path
+
+    def _open_file(self, title: str, name_filter: str) -> str:
+        """Ask for an existing file, starting where this dialog last left off."""
+        return self._choose_path(title, QFileDialog.FileMode.ExistingFile, name_filter)
+
+    def _save_file(self, title: str, name_filter: str) -> str:
+        """Ask for an output file, starting where this dialog last left off."""
+        return self._choose_path(title, QFileDialog.FileMode.AnyFile, name_filter, save=True)
+
+    def _open_directory(self, title: str) -> str:
+        """Ask for a directory, starting where this dialog last left off."""
+        return self._choose_path(title, QFileDialog.FileMode.Directory)
+
     def _persist_config(self) -> None:
+        """Schedule a config write; restarting the timer coalesces bursts."""
+        self._save_timer.start()
+
+    @Slot()
+    def _write_config(self) -> None:
         """Write current UI settings and preferences to the config file."""
-        save_config(
-            {
-                "hemtt_path": self.hemtt_entry.text().strip() or "hemtt",
-                "project_dir": self.proj_entry.text().strip() or os.getcwd(),
-                "arma3_executable": self.arma3_entry.text().strip(),
-                "dark_mode": self.dark_mode,
-            }
-        )
+        cfg = {
+            "hemtt_path": self.hemtt_entry.text().strip() or "hemtt",
+            "project_dir": self.proj_entry.text().strip() or self._cwd,
+            "arma3_executable": self.arma3_entry.text().strip(),
+            "dark_mode": self.dark_mode,
+            "last_dirs": dict(self._last_dirs),
+        }
+        # Toggling back and forth or re-picking the same path changes nothing
+        if cfg == self._saved_config:
+            return
+        save_config(cfg)
+        self._saved_config = cfg
 
     def _toggle_dark_mode(self) -> None:
         """Toggle between light and dark mode and persist preference."""
@@ -719,11 +1020,11 @@ class HemttGUI(QMainWindow):
 
     def _apply_dark_mode(self) -> None:
         """Apply dark mode colors to the entire GUI."""
-        self._apply_theme(self.dark_theme, self.dark_button_style, self.dark_header_style)
+        self._apply_theme(self.dark_theme, self._DARK_QSS + _DIALOG_DARK_QSS, self._DARK_HEADER_QSS)
 
     def _apply_light_mode(self) -> None:
         """Apply light mode colors to the entire GUI."""
-        self._apply_theme(self.light_theme, self.light_button_style, self.light_header_style)
+        self._apply_theme(self.light_theme, self._LIGHT_QSS, self._LIGHT_HEADER_QSS)
 
     def _apply_theme(self, theme: dict, button_style: str, header_style: str | None = None) -> None:
         """Apply a theme's colors and button styles to the GUI.
@@ -747,113 +1048,49 @@ class HemttGUI(QMainWindow):
 
         # Store theme colors for text formatting
         self.current_theme = theme
+        self._severity_formats = {None: QTextCharFormat()}
+        for level in _SEVERITY_KEYWORDS:
+            fmt = QTextCharFormat()
+            fmt.setForeground(theme[level])
+            self._severity_formats[level] = fmt
+
+        # Parsed once for the whole application instead of per button
+        cast(QApplication, QApplication.instance()).setStyleSheet(button_style)
 
-        # Apply button styles
-        self.button_style = button_style
+        # Collapsible section headers keep their own widget-level sheet
         if header_style is not None:
             self.header_style = header_style
-        self._apply_button_styles()
-
-    def _apply_button_styles(self) -> None:
-        """Apply current button style to all buttons in the GUI."""
-        # List of button attribute names
-        button_attrs = [
-            "btn_install_hemtt",
-            "btn_update_hemtt",
-            "hemtt_browse",
-            "proj_browse",
-            "arma3_browse",
-            "btn_check",
-            "btn_dev",
-            "btn_launch",
-            "btn_build",
-            "btn_release",
-            "btn_cancel",
-            "btn_ln_sort",
-            "btn_ln_coverage",
-            "btn_utils_fnl",
-            "btn_utils_bom",
-            "btn_book",
-            "btn_paa_convert",
-            "btn_paa_inspect",
-            "btn_pbo_inspect",
-            "btn_pbo_unpack",
-            "btn_utils_inspect",
-            "btn_utils_verify",
-            "btn_pbo_extract",
-            "btn_wiki_force_pull",
-            "btn_audio_inspect",
-            "btn_audio_convert",
-            "btn_audio_compress",
-            "btn_config_inspect",
-            "btn_config_derapify",
-            "btn_p3d_json",
-            "btn_sqf_case",
-            "btn_new",
-            "btn_license",
-            "btn_script",
-            "btn_value",
-            "btn_keys_generate",
-            "btn_dark_mode",
-            "btn_custom",
-        ]
-        # Apply style only to buttons that exist
-        for attr_name in button_attrs:
-            if hasattr(self, attr_name):
-                button = getattr(self, attr_name)
-                button.setStyleSheet(self.button_style)
-
-        # Update collapsible section header toggle buttons
         for hdr in getattr(self, "_collapsible_headers", []):
             hdr.setStyleSheet(self.header_style)
 
-    def _append_output(self, text: str):
-        """Append a line to the output widget with basic severity highlighting."""
-        # Detect log level and apply appropriate color
-        text_lower = text.lower()
-        color = None
-
-        # Check for error patterns
-        if any(
-            pattern in text_lower for pattern in ["error", "err:", "fatal", "failed", "failure"]
-        ):
-            color = self.current_theme["error"].name()
-        # Check for warning patterns
-        elif any(pattern in text_lower for pattern in ["warning", "warn:", "caution"]):
-            color = self.current_theme["warning"].name()
-        # Check for info patterns
-        elif any(pattern in text_lower for pattern in ["info", "information", "note:", "hint:"]):
-            color = self.current_theme["info"].name()
-
-        # Move cursor to end and insert text
-        cursor = self.output.textCursor()
-        cursor.movePosition(cursor.MoveOperation.End)
+    def _emit_output(self, text: str) -> None:
+        """Classify a runner batch on its output thread and hand it to the GUI."""
+        self.output_received.emit(_classify_output(text))
 
-        if color:
-            cursor.insertHtml(
-                f'<span style="color: {color};">{text.replace("<", "&lt;").replace(">", "&gt;")}</span><br>'
-            )
-        else:
-            # Ensure text ends with newline if not already present
-            if not text.endswith("\n"):
-                text += "\n"
-            cursor.insertText(text)
+    @Slot(object)
+    def _on_output(self, runs: list[tuple[str | None, str]]) -> None:
+        """Append classified output runs to the output widget.
 
+        Each run is inserted as plain text with a prebuilt character format,
+        so no HTML is ever parsed.
+        """
+        formats = self._severity_formats
+        self.output.setUpdatesEnabled(False)
+        cursor = self.output.textCursor()
+        cursor.movePosition(cursor.MoveOperation.End)
+        for level, text in runs:
+            cursor.insertText(text, formats[level])
         self.output.setTextCursor(cursor)
+        self.output.setUpdatesEnabled(True)
         self.output.ensureCursorVisible()
 
-    def _enqueue_output(self, text: str):
-        """Queue text from the background runner for UI-thread insertion."""
-        self.output_queue.put(text)
+    def _append_output(self, text: str) -> None:
+        """Append a GUI-generated message to the output widget."""
+        self._on_output(_classify_output(text))
 
-    def _poll_output_queue(self) -> None:
-        """Drain the output queue periodically and update elapsed time."""
-        try:
-            while True:
-                text = self.output_queue.get_nowait()
-                self._append_output(text)
-        except queue.Empty:
-            pass
+    @Slot()
+    def _update_elapsed(self) -> None:
+        """Refresh the elapsed-time label while a command is running."""
         if self.running and self.start_time:
             elapsed = time.time() - self.start_time
             self.elapsed_label.setText(f"Elapsed: {elapsed:0.1f}s")
@@ -863,42 +1100,7 @@ class HemttGUI(QMainWindow):
     def _set_running(self, running: bool, command_str: str | None = None):
         """Enable/disable widgets and update status based on run state."""
         self.running = running
-        widgets = [
-            self.btn_build,
-            self.btn_release,
-            self.btn_check,
-            self.btn_dev,
-            self.btn_launch,
-            self.btn_utils_fnl,
-            self.btn_utils_bom,
-            self.btn_ln_sort,
-            self.btn_ln_coverage,
-            self.btn_paa_convert,
-            self.btn_paa_inspect,
-            self.btn_pbo_inspect,
-            self.btn_pbo_unpack,
-            self.btn_utils_inspect,
-            self.btn_utils_verify,
-            self.btn_pbo_extract,
-            self.btn_wiki_force_pull,
-            self.btn_audio_inspect,
-            self.btn_audio_convert,
-            self.btn_audio_compress,
-            self.btn_config_inspect,
-            self.btn_config_derapify,
-            self.btn_p3d_json,
-            self.btn_sqf_case,
-            self.btn_new,
-            self.btn_license,
-            self.btn_script,
-            self.btn_value,
-            self.btn_keys_generate,
-            self.btn_install_hemtt,
-            self.btn_update_hemtt,
-            self.btn_custom,
-            self.custom_entry,
-        ]
-        for w in widgets:
+        for w in self._run_widgets:
             w.setEnabled(not running)
 
         self.btn_cancel.setEnabled(running)
@@ -906,9 +1108,12 @@ class HemttGUI(QMainWindow):
         if running:
             self.status_label.setText(f"Running: {command_str}")
             self.start_time = time.time()
+            self.elapsed_timer.start(100)
         else:
             self.status_label.setText("Ready")
             self.start_time = 0.0
+            self.elapsed_timer.stop()
+        self._update_elapsed()
 
     def _validated_paths(self) -> tuple[str, str] | None:
         """Validate and resolve the HEMTT executable and project directory.
@@ -917,21 +1122,23 @@ class HemttGUI(QMainWindow):
         validation fails and the user cancels.
         """
         hemtt = self.hemtt_entry.text().strip() or "hemtt"
-        proj = self.proj_entry.text().strip() or os.getcwd()
+        proj = self.proj_entry.text().strip() or self._cwd
 
         if not os.path.isdir(proj):
             QMessageBox.critical(self, APP_TITLE, f"Project directory not found:\n{proj}")
             return None
 
-        # If hemtt is not an explicit path, allow PATH resolution
-        if (
-            os.path.sep in hemtt or (os.path.altsep and os.path.altsep in hemtt)
-        ) and not os.path.isfile(hemtt):
-            QMessageBox.critical(self, APP_TITLE, f"HEMTT executable not found:\n{hemtt}")
-            return None
-        elif os.path.sep not in hemtt and (not os.path.altsep or os.path.altsep not in hemtt):
-            resolved = shutil.which(hemtt)
-            if resolved is None:
+        # A directory component marks an explicit path; bare names resolve via PATH
+        if os.path.dirname(hemtt):
+            if not os.path.isfile(hemtt):
+                QMessageBox.critical(self, APP_TITLE, f"HEMTT executable not found:\n{hemtt}")
+                return None
+        else:
+            resolved = self._which(hemtt)
+            if resolved is not None:
+                # Launch the resolved file so the OS doesn't search PATH again
+                hemtt = resolved
+            else:
                 # Still allow to try, but warn user
                 reply = QMessageBox.question(
                     self,
@@ -943,18 +1150,30 @@ class HemttGUI(QMainWindow):
                     return None
         return hemtt, proj
 
-    def _run(self, args: list[str], command_type: str = "other", cwd: str | None = None):
+    def _which(self, name: str) -> str | None:
+        """Resolve an executable name on PATH, caching successful lookups."""
+        resolved = self._which_cache.get(name)
+        if resolved is None:
+            resolved = shutil.which(name)
+            if resolved is not None:
+                self._which_cache[name] = resolved
+        return resolved
+
+    def _run(self, args: Sequence[str], command_type: str = "other", cwd: str | None = None):
         """Start running a HEMTT command with arguments from dialogs.
 
         Parameters
         ----------
-        args: list[str]
+        args: Sequence[str]
             Full arguments after the 'hemtt' executable, including all flags.
         command_type: str
             Type of command for tracking purposes.
         cwd: str | None
             Optional working directory. If None, uses project directory.
         """
+        # One command at a time; a queued second click must not replace the runner
+        if self.running:
+            return
         validated = self._validated_paths()
         if not validated:
             return
@@ -973,14 +1192,15 @@ class HemttGUI(QMainWindow):
         self.runner = CommandRunner(
             command=cmd,
             cwd=working_dir,
-            on_output=self._enqueue_output,
-            on_exit=self._on_command_exit,
+            on_output=self._emit_output,
+            on_exit=self.command_finished.emit,
         )
         self.runner.start()
 
+    @Slot(object)
     def _on_command_exit(self, returncode: int):
         """Handle process termination and update UI state."""
-        self._enqueue_output(f"\n[Process exited with code {returncode}]\n")
+        self._append_output(f"\n[Process exited with code {returncode}]\n")
         self._set_running(False)
         self.runner = None
 
@@ -988,117 +1208,69 @@ class HemttGUI(QMainWindow):
         """Request cancellation of the running process, if any."""
         if self.runner:
             self.runner.cancel()
-            self._enqueue_output("\n[Cancellation requested]\n")
-
-    # Button handlers
-    def _run_build(self) -> None:
-        """Open build dialog and run hemtt build with selected options."""
-        dialog = BuildDialog(self, self.dark_mode)
-        if dialog.exec() == QDialog.Accepted:
-            args = dialog.get_args()
-            self._run(args, command_type="build")
-
-    def _run_release(self) -> None:
-        """Open release dialog and run hemtt release with selected options."""
-        dialog = ReleaseDialog(self, self.dark_mode)
-        if dialog.exec() == QDialog.Accepted:
-            args = dialog.get_args()
-            self._run(args, command_type="release")
-
-    def _run_check(self) -> None:
-        """Open check dialog and run hemtt check with selected options."""
-        dialog = CheckDialog(self, self.dark_mode)
-        if dialog.exec() == QDialog.Accepted:
-            args = dialog.get_args()
-            self._run(args, command_type="check")
-
-    def _run_dev(self) -> None:
-        """Open dev dialog and run hemtt dev with selected options."""
-        dialog = DevDialog(self, self.dark_mode)
-        if dialog.exec() == QDialog.Accepted:
-            args = dialog.get_args()
-            self._run(args, command_type="dev")
-
-    def _run_utils_fnl(self) -> None:
-        """Run 'hemtt utils fnl'."""
-        self._run(["utils", "fnl"], command_type="other")
+            self._append_output("\n[Cancellation requested]\n")
 
-    def _run_utils_bom(self) -> None:
-        """Run 'hemtt utils bom'."""
-        self._run(["utils", "bom"], command_type="other")
+    def _get_dialog(self, dialog_cls: type["BaseCommandDialog"]) -> "BaseCommandDialog":
+        """Return the cached instance of a command dialog, creating it on first use.
 
-    def _run_ln_sort(self) -> None:
-        """Run 'hemtt localization sort'."""
-        dialog = LocalizationSortDialog(self, self.dark_mode)
-        if dialog.exec() == QDialog.Accepted:
-            args = dialog.get_args()
-            self._run(args, command_type="other")
+        Reusing the dialog skips rebuilding its widgets and keeps the options
+        chosen the last time it was opened.
+        """
+        dialog = self._dialog_cache.get(dialog_cls)
+        if dialog is None:
+            dialog = self._dialog_cache[dialog_cls] = dialog_cls(self)
+        return dialog
 
-    def _run_ln_coverage(self) -> None:
-        """Run 'hemtt localization coverage'."""
-        dialog = LocalizationCoverageDialog(self, self.dark_mode)
+    # Button handlers
+    def _run_hemtt_dialog(
+        self, dialog_cls: type["BaseCommandDialog"], command_type: str = "other"
+    ) -> None:
+        """Open a command dialog and run HEMTT with its arguments when accepted."""
+        dialog = self._get_dialog(dialog_cls)
         if dialog.exec() == QDialog.Accepted:
-            args = dialog.get_args()
-            self._run(args, command_type="other")
+            self._run(dialog.get_args(), command_type=command_type)
 
     def _run_paa_convert(self) -> None:
         """Open PAA convert dialog and run hemtt utils paa convert with selected files."""
         # Temporarily use file dialog
-        src_file, _ = QFileDialog.getOpenFileName(self, "Select source file", "", "All files (*.*)")
+        src_file = self._open_file("Select source file", "All files (*.*)")
         if src_file:
-            dest_file, _ = QFileDialog.getSaveFileName(
-                self, "Select destination file", "", "All files (*.*)"
-            )
+            dest_file = self._save_file("Select destination file", "All files (*.*)")
             if dest_file:
                 args = ["utils", "paa", "convert", src_file, dest_file]
-                src_dir = os.path.dirname(os.path.abspath(src_file))
+                src_dir = _parent_dir(src_file)
                 self._run(args, command_type="other", cwd=src_dir)
 
-    def _run_paa_inspect(self) -> None:
-        """Open PAA inspect dialog and run hemtt utils paa inspect with selected options."""
-        from PySide6.QtWidgets import QInputDialog
-
-        file_path, _ = QFileDialog.getOpenFileName(self, "Select PAA file", "", "PAA files (*.paa)")
-        if not file_path:
-            return
-
-        formats = ["ascii", "json", "pretty-json", "markdown"]
-        fmt, ok = QInputDialog.getItem(
-            self, "PAA Inspect Format", "Output format:", formats, 0, False
-        )
-        if not ok:
-            return
-
-        args = ["utils", "paa", "inspect", file_path]
-        if fmt != "ascii":
-            args.extend(["--format", fmt])
-        file_dir = os.path.dirname(os.path.abspath(file_path))
-        self._run(args, command_type="other", cwd=file_dir)
+    def _run_format_inspect(self, file_type: str, kind: str) -> None:
+        """Run 'hemtt utils <kind> inspect' on a selected file with a chosen output format.
 
-    def _run_pbo_inspect(self) -> None:
-        """Open PBO inspect dialog and run hemtt utils pbo inspect with selected options."""
+        Parameters
+        ----------
+        file_type : str
+            Human-readable file type (e.g., "PAA", "PBO")
+        kind : str
+            HEMTT utils subcommand, also the file extension (e.g., "paa", "pbo")
+        """
         from PySide6.QtWidgets import QInputDialog
 
-        file_path, _ = QFileDialog.getOpenFileName(self, "Select PBO file", "", "PBO files (*.pbo)")
+        file_path = self._open_file(f"Select {file_type} file", f"{file_type} files (*.{kind})")
         if not file_path:
             return
 
-        formats = ["ascii", "json", "pretty-json", "markdown"]
         fmt, ok = QInputDialog.getItem(
-            self, "PBO Inspect Format", "Output format:", formats, 0, False
+            self, f"{file_type} Inspect Format", "Output format:", _OUTPUT_FORMATS, 0, False
         )
         if not ok:
             return
 
-        args = ["utils", "pbo", "inspect", file_path]
+        args = ["utils", kind, "inspect", file_path]
         if fmt != "ascii":
             args.extend(["--format", fmt])
-        file_dir = os.path.dirname(os.path.abspath(file_path))
-        self._run(args, command_type="other", cwd=file_dir)
+        self._run(args, command_type="other", cwd=_parent_dir(file_path))
 
     def _run_pbo_unpack(self) -> None:
         """Open PBO unpack dialog and run hemtt utils pbo unpack with selected options."""
-        pbo_path, _ = QFileDialog.getOpenFileName(self, "Select PBO file", "", "PBO files (*.pbo)")
+        pbo_path = self._open_file("Select PBO file", "PBO files (*.pbo)")
         if not pbo_path:
             return
 
@@ -1110,7 +1282,7 @@ class HemttGUI(QMainWindow):
             QMessageBox.Yes | QMessageBox.No,
         )
         if use_output_dir == QMessageBox.Yes:
-            output_dir = QFileDialog.getExistingDirectory(self, "Select output directory", "")
+            output_dir = self._open_directory("Select output directory")
             if not output_dir:
                 return
 
@@ -1130,38 +1302,34 @@ class HemttGUI(QMainWindow):
         if derap:
             args.append("-r")
 
-        file_dir = os.path.dirname(os.path.abspath(pbo_path))
+        file_dir = _parent_dir(pbo_path)
         self._run(args, command_type="other", cwd=file_dir)
 
     def _run_utils_inspect(self) -> None:
         """Run 'hemtt utils inspect <FILE>' for a selected file."""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select file to inspect", "", "All files (*.*)"
-        )
+        file_path = self._open_file("Select file to inspect", "All files (*.*)")
         if file_path:
-            file_dir = os.path.dirname(os.path.abspath(file_path))
+            file_dir = _parent_dir(file_path)
             self._run(["utils", "inspect", file_path], command_type="other", cwd=file_dir)
 
     def _run_utils_verify(self) -> None:
         """Run 'hemtt utils verify <PBO> <BIKEY>' for selected files."""
-        pbo_path, _ = QFileDialog.getOpenFileName(self, "Select PBO file", "", "PBO files (*.pbo)")
+        pbo_path = self._open_file("Select PBO file", "PBO files (*.pbo)")
         if not pbo_path:
             return
 
-        bikey_path, _ = QFileDialog.getOpenFileName(
-            self, "Select BIKEY file", "", "BIKEY files (*.bikey)"
-        )
+        bikey_path = self._open_file("Select BIKEY file", "BIKEY files (*.bikey)")
         if not bikey_path:
             return
 
-        working_dir = os.path.dirname(os.path.abspath(pbo_path))
+        working_dir = _parent_dir(pbo_path)
         self._run(["utils", "verify", pbo_path, bikey_path], command_type="other", cwd=working_dir)
 
     def _run_pbo_extract(self) -> None:
         """Run 'hemtt utils pbo extract <PBO> <FILE> [OUTPUT]' from dialog inputs."""
         from PySide6.QtWidgets import QInputDialog
 
-        pbo_path, _ = QFileDialog.getOpenFileName(self, "Select PBO file", "", "PBO files (*.pbo)")
+        pbo_path = self._open_file("Select PBO file", "PBO files (*.pbo)")
         if not pbo_path:
             return
 
@@ -1176,52 +1344,37 @@ class HemttGUI(QMainWindow):
         if not ok or not file_in_pbo:
             return
 
-        output_path, _ = QFileDialog.getSaveFileName(
-            self,
-            "Optional output file (Cancel to print to output)",
-            "",
-            "All files (*.*)",
+        output_path = self._save_file(
+            "Optional output file (Cancel to print to output)", "All files (*.*)"
         )
 
         args = ["utils", "pbo", "extract", pbo_path, file_in_pbo]
         if output_path:
             args.append(output_path)
 
-        working_dir = os.path.dirname(os.path.abspath(pbo_path))
+        working_dir = _parent_dir(pbo_path)
         self._run(args, command_type="other", cwd=working_dir)
 
-    def _run_wiki_force_pull(self) -> None:
-        """Run 'hemtt wiki force-pull'."""
-        self._run(["wiki", "force-pull"], command_type="other")
-
     def _run_audio_inspect(self) -> None:
         """Run 'hemtt utils audio inspect <FILE>'."""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Select audio file",
-            "",
-            "Audio files (*.wss *.wav *.ogg *.mp3);;All files (*.*)",
+        file_path = self._open_file(
+            "Select audio file", "Audio files (*.wss *.wav *.ogg *.mp3);;All files (*.*)"
         )
         if file_path:
-            file_dir = os.path.dirname(os.path.abspath(file_path))
+            file_dir = _parent_dir(file_path)
             self._run(["utils", "audio", "inspect", file_path], command_type="other", cwd=file_dir)
 
     def _run_audio_convert(self) -> None:
         """Run 'hemtt utils audio convert <FILE> <OUTPUT>'."""
         from PySide6.QtWidgets import QInputDialog
 
-        src_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Select source audio file",
-            "",
-            "Audio files (*.wss *.wav *.ogg *.mp3);;All files (*.*)",
+        src_path = self._open_file(
+            "Select source audio file", "Audio files (*.wss *.wav *.ogg *.mp3);;All files (*.*)"
         )
         if not src_path:
             return
 
-        output_path, _ = QFileDialog.getSaveFileName(
-            self, "Select output file", "", "All files (*.*)"
-        )
+        output_path = self._save_file("Select output file", "All files (*.*)")
         if not output_path:
             return
 
@@ -1241,33 +1394,24 @@ class HemttGUI(QMainWindow):
                 return
             args.extend(["-c", compression])
 
-        src_dir = os.path.dirname(os.path.abspath(src_path))
+        src_dir = _parent_dir(src_path)
         self._run(args, command_type="other", cwd=src_dir)
 
-    def _run_audio_compress(self) -> None:
-        """Run 'hemtt utils audio compress'."""
-        self._run(["utils", "audio", "compress"], command_type="other")
-
     def _run_config_inspect(self) -> None:
         """Run 'hemtt utils config inspect <CONFIG>'."""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Select config file",
-            "",
-            "Config files (*.cpp *.hpp *.rvmat *.bin);;All files (*.*)",
+        file_path = self._open_file(
+            "Select config file", "Config files (*.cpp *.hpp *.rvmat *.bin);;All files (*.*)"
         )
         if file_path:
-            file_dir = os.path.dirname(os.path.abspath(file_path))
+            file_dir = _parent_dir(file_path)
             self._run(["utils", "config", "inspect", file_path], command_type="other", cwd=file_dir)
 
     def _run_config_derapify(self) -> None:
         """Run 'hemtt utils config derapify <FILE> [OUTPUT]' with format selection."""
         from PySide6.QtWidgets import QInputDialog
 
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
+        file_path = self._open_file(
             "Select config file to derapify",
-            "",
             "Config files (*.bin *.cpp *.hpp *.rvmat);;All files (*.*)",
         )
         if not file_path:
@@ -1278,62 +1422,36 @@ class HemttGUI(QMainWindow):
         if not ok:
             return
 
-        output_path, _ = QFileDialog.getSaveFileName(
-            self, "Optional output file", "", "All files (*.*)"
-        )
+        output_path = self._save_file("Optional output file", "All files (*.*)")
 
         args = ["utils", "config", "derapify", "-f", fmt, file_path]
         if output_path:
             args.append(output_path)
 
-        file_dir = os.path.dirname(os.path.abspath(file_path))
+        file_dir = _parent_dir(file_path)
         self._run(args, command_type="other", cwd=file_dir)
 
     def _run_p3d_json(self) -> None:
         """Run 'hemtt utils p3d json <P3D> <OUTPUT>'."""
-        p3d_path, _ = QFileDialog.getOpenFileName(self, "Select P3D file", "", "P3D files (*.p3d)")
+        p3d_path = self._open_file("Select P3D file", "P3D files (*.p3d)")
         if not p3d_path:
             return
 
-        output_path, _ = QFileDialog.getSaveFileName(
-            self, "Select JSON output", "", "JSON files (*.json)"
-        )
+        output_path = self._save_file("Select JSON output", "JSON files (*.json)")
         if not output_path:
             return
 
-        p3d_dir = os.path.dirname(os.path.abspath(p3d_path))
+        p3d_dir = _parent_dir(p3d_path)
         self._run(
             ["utils", "p3d", "json", p3d_path, output_path], command_type="other", cwd=p3d_dir
         )
 
     def _run_sqf_case(self) -> None:
         """Run 'hemtt utils sqf case <PATH>' for a selected folder."""
-        path = QFileDialog.getExistingDirectory(self, "Select folder for SQF case correction", "")
+        path = self._open_directory("Select folder for SQF case correction")
         if path:
             self._run(["utils", "sqf", "case", path], command_type="other", cwd=path)
 
-    def _run_file_operation(
-        self, file_type: str, filter_pattern: str, base_args: list[str]
-    ) -> None:
-        """Helper method for file-based operations (PAA/PBO inspect/unpack).
-
-        Parameters
-        ----------
-        file_type : str
-            Human-readable file type (e.g., "PAA", "PBO")
-        filter_pattern : str
-            File filter pattern (e.g., "*.paa", "*.pbo")
-        base_args : list[str]
-            Base command arguments before the filename
-        """
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, f"Select {file_type} file", "", f"{file_type} files ({filter_pattern})"
-        )
-        if file_path:
-            args = base_args + [file_path]
-            file_dir = os.path.dirname(os.path.abspath(file_path))
-            self._run(args, command_type="other", cwd=file_dir)
-
     def _run_custom(self) -> None:
         """Run a custom argument list typed by the user after 'hemtt'."""
         extra = self.custom_entry.text().strip()
@@ -1497,7 +1615,7 @@ class HemttGUI(QMainWindow):
         cmd_str = " ".join(cmd_parts)
 
         # Determine working directory
-        cwd = project_dir if project_dir and os.path.isdir(project_dir) else os.getcwd()
+        cwd = project_dir if project_dir and os.path.isdir(project_dir) else self._cwd
 
         # Show info message
         QMessageBox.information(
@@ -1576,29 +1694,34 @@ class HemttGUI(QMainWindow):
         label: str
             Short label for status bar.
         """
+        if self.running:
+            return
+
         # Clear output
         self.output.clear()
 
-        cmd = ["winget", *winget_args]
+        cmd = [self._which("winget") or "winget", *winget_args]
         self._set_running(True, " ".join(cmd))
 
         self.runner = CommandRunner(
             command=cmd,
-            cwd=os.getcwd(),
-            on_output=self._enqueue_output,
-            on_exit=self._on_command_exit,
+            cwd=self._cwd,
+            on_output=self._emit_output,
+            on_exit=self.command_finished.emit,
         )
         self.runner.start()
 
     def _run_launch(self) -> None:
         """Open launch dialog and run hemtt launch with selected options."""
-        dialog = LaunchDialog(self, self.dark_mode)
+        dialog = self._get_dialog(LaunchDialog)
         if dialog.exec() == QDialog.Accepted:
             args = dialog.get_args()
             self._run(args, command_type="launch")
 
     def _open_book(self) -> None:
         """Open the HEMTT documentation in the default web browser."""
+        import webbrowser
+
         try:
             webbrowser.open("https://hemtt.dev")
         except Exception as e:
@@ -1616,7 +1739,12 @@ class HemttGUI(QMainWindow):
             if reply != QMessageBox.Yes:
                 event.ignore()
                 return
-        self._persist_config()
+            # Runner threads are daemons and die with the app; stop the process
+            # too so HEMTT is not left running on its own
+            self.runner.cancel()
+        # Flush any pending write synchronously before the window goes away
+        self._save_timer.stop()
+        self._write_config()
         event.accept()
 
 
@@ -1626,441 +1754,328 @@ class HemttGUI(QMainWindow):
 
 
 class BaseCommandDialog(QDialog):
-    """Base class for command dialogs with common widgets and styling."""
+    """Base class for command dialogs with common widgets and styling.
+
+    Subclasses set their window title in ``_TITLE`` and describe their
+    arguments declaratively; the default :meth:`get_args` emits ``_COMMAND``,
+    then the flag of each checked ``_FLAG_SPEC`` checkbox, then one
+    ``flag value`` pair per token of each ``_ENTRY_SPEC`` line edit, then the
+    threads and verbosity arguments.
+    """
+
+    _TITLE = ""
+    _COMMAND: tuple[str, ...] = ()
+    _FLAG_SPEC: tuple[tuple[str, str], ...] = ()  # (checkbox attribute, flag)
+    _ENTRY_SPEC: tuple[tuple[str, str], ...] = ()  # (line edit attribute, flag)
+    _flag_getters: tuple[tuple[attrgetter, str], ...] = ()
+    _entry_getters: tuple[tuple[attrgetter, str], ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        """Resolve the subclass's argument specs to attribute getters once."""
+        super().__init_subclass__(**kwargs)
+        cls._flag_getters = _spec_getters(cls._FLAG_SPEC)
+        cls._entry_getters = _spec_getters(cls._ENTRY_SPEC)
 
-    def __init__(self, parent, title: str, dark_mode: bool = False):
+    def __init__(self, parent):
         super().__init__(parent)
-        self.setWindowTitle(title)
+        self.setWindowTitle(self._TITLE)
         self.setMinimumWidth(450)
-        self.dark_mode = dark_mode
         self.main_layout = QVBoxLayout(self)
-
-        # Apply dark mode styling if needed
-        if dark_mode:
-            self.setStyleSheet(
-                """
-                QDialog { background-color: #2b2b2b; color: #e0e0e0; }
-                QLabel { color: #e0e0e0; }
-                QCheckBox { color: #e0e0e0; }
-                QRadioButton { color: #e0e0e0; }
-                QGroupBox { color: #e0e0e0; border: 1px solid #555; border-radius: 4px; margin-top: 8px; padding-top: 8px; }
-                QGroupBox::title { subcontrol-origin: margin; subcontrol-position: top left; padding: 0 5px; }
-                QLineEdit { background-color: #3b3b3b; color: #e0e0e0; border: 1px solid #555; border-radius: 3px; padding: 4px; }
-                QComboBox { background-color: #3b3b3b; color: #e0e0e0; border: 1px solid #555; border-radius: 3px; padding: 4px; }
-                QSpinBox { background-color: #3b3b3b; color: #e0e0e0; border: 1px solid #555; border-radius: 3px; padding: 4px; }
-            """
-            )
+        # Set by add_verbosity_section/add_threads_section when the dialog has them
+        self.verbosity_combo: QComboBox | None = None
+        self.threads_spinbox: QSpinBox | None = None
+
+    def add_section_header(self, title: str) -> QLabel:
+        """Add a bold section title; the section's widgets follow in the main layout."""
+        header = QLabel(title)
+        font = header.font()
+        font.setBold(True)
+        header.setFont(font)
+        self.main_layout.addWidget(header)
+        return header
+
+    def add_form_row(self, label: str, field: QWidget) -> QWidget:
+        """Add a labelled field, sharing a QFormLayout with directly preceding rows."""
+        layout = self.main_layout
+        last = layout.itemAt(layout.count() - 1)
+        form = last.layout() if last is not None else None
+        if not isinstance(form, QFormLayout):
+            form = QFormLayout()
+            form.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow)
+            layout.addLayout(form)
+        form.addRow(label, field)
+        return field
 
     def add_verbosity_section(self):
-        """Add verbosity radio buttons (Normal/-v/-vv)."""
-        verbosity_group = QGroupBox("Verbosity")
-        verbosity_layout = QVBoxLayout()
-
-        self.verbosity_normal = QRadioButton("Normal (default)")
-        self.verbosity_debug = QRadioButton("Debug (-v)")
-        self.verbosity_trace = QRadioButton("Trace (-vv)")
-        self.verbosity_normal.setChecked(True)
-
-        verbosity_layout.addWidget(self.verbosity_normal)
-        verbosity_layout.addWidget(self.verbosity_debug)
-        verbosity_layout.addWidget(self.verbosity_trace)
-        verbosity_group.setLayout(verbosity_layout)
-
-        self.main_layout.addWidget(verbosity_group)
-        return verbosity_group
+        """Add verbosity selector (Normal/-v/-vv)."""
+        self.verbosity_combo = QComboBox()
+        self.verbosity_combo.addItems(("Normal (default)", "Debug (-v)", "Trace (-vv)"))
+        return self.add_form_row("Verbosity:", self.verbosity_combo)
 
     def add_threads_section(self):
         """Add threads spinner."""
-        threads_layout = QHBoxLayout()
-        threads_label = QLabel("Threads:")
         self.threads_spinbox = QSpinBox()
-        self.threads_spinbox.setMinimum(1)
-        self.threads_spinbox.setMaximum(128)
-        self.threads_spinbox.setValue(os.cpu_count() or 4)
+        self.threads_spinbox.setRange(1, 128)
+        self.threads_spinbox.setValue(_DEFAULT_THREADS)
         self.threads_spinbox.setSpecialValueText("Default (auto)")
-        threads_layout.addWidget(threads_label)
-        threads_layout.addWidget(self.threads_spinbox)
-        threads_layout.addStretch()
-
-        self.main_layout.addLayout(threads_layout)
-        return threads_layout
+        return self.add_form_row("Threads:", self.threads_spinbox)
 
     def add_buttons(self):
         """Add standard OK/Cancel buttons."""
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons = QDialogButtonBox(_OK_CANCEL)
         buttons.accepted.connect(self.accept)
         buttons.rejected.connect(self.reject)
         self.main_layout.addWidget(buttons)
         return buttons
 
-    def get_verbosity_args(self) -> list[str]:
+    def get_verbosity_args(self) -> tuple[str, ...]:
         """Get verbosity arguments based on selection."""
-        if self.verbosity_debug.isChecked():
-            return ["-v"]
-        elif self.verbosity_trace.isChecked():
-            return ["-vv"]
-        return []
+        if self.verbosity_combo is None:
+            return _VERBOSITY_NORMAL
+        return _VERBOSITY_ARGS[self.verbosity_combo.currentIndex()]
 
     def get_threads_args(self) -> list[str]:
         """Get threads arguments if not default."""
+        if self.threads_spinbox is None:
+            return []
         threads = self.threads_spinbox.value()
-        if threads != (os.cpu_count() or 4):
+        if threads != _DEFAULT_THREADS:
             return ["-t", str(threads)]
         return []
 
+    def get_flag_args(self, getters: tuple[tuple[attrgetter, str], ...]) -> list[str]:
+        """Get the flag of every checked checkbox in ``(attrgetter, flag)`` pairs."""
+        return [flag for get, flag in getters if get(self).isChecked()]
+
+    @staticmethod
+    def get_repeated_args(entry: QLineEdit, flag: str) -> list[str]:
+        """Get ``flag value`` pairs for each whitespace-separated value in an entry."""
+        args: list[str] = []
+        for value in _split_tokens(entry.text()):
+            args.extend((flag, value))
+        return args
+
+    def get_args(self) -> list[str]:
+        """Build argument list from the dialog's argument spec."""
+        args = list(self._COMMAND)
+        args.extend(self.get_flag_args(self._flag_getters))
+        for get, flag in self._entry_getters:
+            args.extend(self.get_repeated_args(get(self), flag))
+        args.extend(self.get_threads_args())
+        args.extend(self.get_verbosity_args())
+        return args
+
 
 class CheckDialog(BaseCommandDialog):
     """Dialog for 'hemtt check' command options."""
 
-    def __init__(self, parent, dark_mode: bool = False):
-        super().__init__(parent, "HEMTT Check Options", dark_mode)
+    _TITLE = "HEMTT Check Options"
+    _COMMAND = ("check",)
+    _FLAG_SPEC = (("pedantic_check", "-p"), ("error_on_all_check", "-e"))
+    _ENTRY_SPEC = (("lints_entry", "-L"),)
 
-        # Options
-        options_group = QGroupBox("Check Options")
-        options_layout = QVBoxLayout()
+    def __init__(self, parent):
+        super().__init__(parent)
 
-        self.pedantic_check = QCheckBox("Pedantic mode (-p)")
-        self.pedantic_check.setToolTip("Enable all lints that are disabled by default")
+        # Options
+        self.add_section_header("Check Options")
 
-        self.error_on_all_check = QCheckBox("Treat warnings as errors (-e)")
-        self.error_on_all_check.setToolTip("Treat all help and warning messages as errors")
+        self.pedantic_check = _flag_checkbox("Pedantic mode (-p)", "-p")
+        self.error_on_all_check = _flag_checkbox("Treat warnings as errors (-e)", "-e")
 
-        options_layout.addWidget(self.pedantic_check)
-        options_layout.addWidget(self.error_on_all_check)
+        _add_widgets(self.main_layout, self.pedantic_check, self.error_on_all_check)
 
         # Custom lints
-        lints_layout = QHBoxLayout()
-        lints_label = QLabel("Custom lints (-L):")
         self.lints_entry = QLineEdit()
         self.lints_entry.setPlaceholderText("e.g., s01-invalid-command s02-unknown-command")
-        lints_layout.addWidget(lints_label)
-        lints_layout.addWidget(self.lints_entry)
-        options_layout.addLayout(lints_layout)
-
-        options_group.setLayout(options_layout)
-        self.main_layout.addWidget(options_group)
+        self.add_form_row("Custom lints (-L):", self.lints_entry)
 
         # Verbosity and threads
         self.add_verbosity_section()
         self.add_threads_section()
         self.add_buttons()
 
-    def get_args(self) -> list[str]:
-        """Build argument list from dialog selections."""
-        args = ["check"]
-
-        if self.pedantic_check.isChecked():
-            args.append("-p")
-
-        if self.error_on_all_check.isChecked():
-            args.append("-e")
-
-        lints_text = self.lints_entry.text().strip()
-        if lints_text:
-            for lint in lints_text.split():
-                args.extend(["-L", lint])
-
-        args.extend(self.get_threads_args())
-        args.extend(self.get_verbosity_args())
-
-        return args
-
 
 class DevDialog(BaseCommandDialog):
     """Dialog for 'hemtt dev' command options."""
 
-    def __init__(self, parent, dark_mode: bool = False):
-        super().__init__(parent, "HEMTT Dev Options", dark_mode)
+    _TITLE = "HEMTT Dev Options"
+    _COMMAND = ("dev",)
+    _FLAG_SPEC = (
+        ("binarize_check", "-b"),
+        ("no_rap_check", "--no-rap"),
+        ("all_optionals_check", "-O"),
+    )
+    _ENTRY_SPEC = (("optionals_entry", "-o"), ("just_entry", "--just"))
 
-        # Build options
-        build_group = QGroupBox("Build Options")
-        build_layout = QVBoxLayout()
+    def __init__(self, parent):
+        super().__init__(parent)
 
-        self.binarize_check = QCheckBox("Binarize (-b)")
-        self.binarize_check.setToolTip("Use BI's binarize on supported files")
+        # Build options
+        self.add_section_header("Build Options")
 
-        self.no_rap_check = QCheckBox("No rapify (--no-rap)")
-        self.no_rap_check.setToolTip("Do not rapify (cpp, rvmat, ext, sqm, bikb, bisurf)")
+        self.binarize_check = _flag_checkbox("Binarize (-b)", "-b")
+        self.no_rap_check = _flag_checkbox("No rapify (--no-rap)", "--no-rap")
 
-        build_layout.addWidget(self.binarize_check)
-        build_layout.addWidget(self.no_rap_check)
-        build_group.setLayout(build_layout)
-        self.main_layout.addWidget(build_group)
+        _add_widgets(self.main_layout, self.binarize_check, self.no_rap_check)
 
         # Optionals
-        optionals_group = QGroupBox("Optional Addons")
-        optionals_layout = QVBoxLayout()
+        self.add_section_header("Optional Addons")
 
-        self.all_optionals_check = QCheckBox("Include all optionals (-O)")
-        self.all_optionals_check.setToolTip("Include all optional addon folders")
-        optionals_layout.addWidget(self.all_optionals_check)
+        self.all_optionals_check = _flag_checkbox("Include all optionals (-O)", "-O")
+        self.main_layout.addWidget(self.all_optionals_check)
 
-        specific_layout = QHBoxLayout()
-        specific_label = QLabel("Specific optionals (-o):")
         self.optionals_entry = QLineEdit()
         self.optionals_entry.setPlaceholderText("e.g., caramel chocolate")
-        specific_layout.addWidget(specific_label)
-        specific_layout.addWidget(self.optionals_entry)
-        optionals_layout.addLayout(specific_layout)
-
-        optionals_group.setLayout(optionals_layout)
-        self.main_layout.addWidget(optionals_group)
+        self.add_form_row("Specific optionals (-o):", self.optionals_entry)
 
         # Just addons
-        just_layout = QHBoxLayout()
-        just_label = QLabel("Build only (--just):")
         self.just_entry = QLineEdit()
         self.just_entry.setPlaceholderText("e.g., myAddon1 myAddon2")
-        just_layout.addWidget(just_label)
-        just_layout.addWidget(self.just_entry)
-        self.main_layout.addLayout(just_layout)
+        self.add_form_row("Build only (--just):", self.just_entry)
 
         # Verbosity and threads
         self.add_verbosity_section()
         self.add_threads_section()
         self.add_buttons()
 
-    def get_args(self) -> list[str]:
-        """Build argument list from dialog selections."""
-        args = ["dev"]
-
-        if self.binarize_check.isChecked():
-            args.append("-b")
-
-        if self.no_rap_check.isChecked():
-            args.append("--no-rap")
-
-        if self.all_optionals_check.isChecked():
-            args.append("-O")
-
-        optionals_text = self.optionals_entry.text().strip()
-        if optionals_text:
-            for opt in optionals_text.split():
-                args.extend(["-o", opt])
-
-        just_text = self.just_entry.text().strip()
-        if just_text:
-            for addon in just_text.split():
-                args.extend(["--just", addon])
-
-        args.extend(self.get_threads_args())
-        args.extend(self.get_verbosity_args())
-
-        return args
-
 
 class BuildDialog(BaseCommandDialog):
     """Dialog for 'hemtt build' command options."""
 
-    def __init__(self, parent, dark_mode: bool = False):
-        super().__init__(parent, "HEMTT Build Options", dark_mode)
+    _TITLE = "HEMTT Build Options"
+    _COMMAND = ("build",)
+    _FLAG_SPEC = (("no_bin_check", "--no-bin"), ("no_rap_check", "--no-rap"))
+    _ENTRY_SPEC = (("just_entry", "--just"),)
 
-        # Build options
-        options_group = QGroupBox("Build Options")
-        options_layout = QVBoxLayout()
+    def __init__(self, parent):
+        super().__init__(parent)
 
-        self.no_bin_check = QCheckBox("No binarize (--no-bin)")
-        self.no_bin_check.setToolTip("Do not binarize the project")
+        # Build options
+        self.add_section_header("Build Options")
 
-        self.no_rap_check = QCheckBox("No rapify (--no-rap)")
-        self.no_rap_check.setToolTip("Do not rapify (cpp, rvmat, ext, sqm, bikb, bisurf)")
+        self.no_bin_check = _flag_checkbox("No binarize (--no-bin)", "--no-bin")
+        self.no_rap_check = _flag_checkbox("No rapify (--no-rap)", "--no-rap")
 
-        options_layout.addWidget(self.no_bin_check)
-        options_layout.addWidget(self.no_rap_check)
-        options_group.setLayout(options_layout)
-        self.main_layout.addWidget(options_group)
+        _add_widgets(self.main_layout, self.no_bin_check, self.no_rap_check)
 
         # Just addons
-        just_layout = QHBoxLayout()
-        just_label = QLabel("Build only (--just):")
         self.just_entry = QLineEdit()
         self.just_entry.setPlaceholderText("e.g., myAddon1 myAddon2")
-        just_layout.addWidget(just_label)
-        just_layout.addWidget(self.just_entry)
-        self.main_layout.addLayout(just_layout)
+        self.add_form_row("Build only (--just):", self.just_entry)
 
         # Verbosity and threads
         self.add_verbosity_section()
         self.add_threads_section()
         self.add_buttons()
 
-    def get_args(self) -> list[str]:
-        """Build argument list from dialog selections."""
-        args = ["build"]
-
-        if self.no_bin_check.isChecked():
-            args.append("--no-bin")
-
-        if self.no_rap_check.isChecked():
-            args.append("--no-rap")
-
-        just_text = self.just_entry.text().strip()
-        if just_text:
-            for addon in just_text.split():
-                args.extend(["--just", addon])
-
-        args.extend(self.get_threads_args())
-        args.extend(self.get_verbosity_args())
-
-        return args
-
 
 class ReleaseDialog(BaseCommandDialog):
     """Dialog for 'hemtt release' command options."""
 
-    def __init__(self, parent, dark_mode: bool = False):
-        super().__init__(parent, "HEMTT Release Options", dark_mode)
-
-        # Release options
-        options_group = QGroupBox("Release Options")
-        options_layout = QVBoxLayout()
-
-        self.no_bin_check = QCheckBox("No binarize (--no-bin)")
-        self.no_bin_check.setToolTip("Do not binarize the project")
-
-        self.no_rap_check = QCheckBox("No rapify (--no-rap)")
-        self.no_rap_check.setToolTip("Do not rapify (cpp, rvmat, ext, sqm, bikb, bisurf)")
-
-        self.no_sign_check = QCheckBox("No sign (--no-sign)")
-        self.no_sign_check.setToolTip("Do not sign the PBOs or create a bikey")
+    _TITLE = "HEMTT Release Options"
+    _COMMAND = ("release",)
+    _FLAG_SPEC = (
+        ("no_bin_check", "--no-bin"),
+        ("no_rap_check", "--no-rap"),
+        ("no_sign_check", "--no-sign"),
+        ("no_archive_check", "--no-archive"),
+    )
 
-        self.no_archive_check = QCheckBox("No archive (--no-archive)")
-        self.no_archive_check.setToolTip("Do not create a zip archive of the release")
+    def __init__(self, parent):
+        super().__init__(parent)
 
-        options_layout.addWidget(self.no_bin_check)
-        options_layout.addWidget(self.no_rap_check)
-        options_layout.addWidget(self.no_sign_check)
-        options_layout.addWidget(self.no_archive_check)
-        options_group.setLayout(options_layout)
-        self.main_layout.addWidget(options_group)
+        # Release options
+        self.add_section_header("Release Options")
+
+        self.no_bin_check = _flag_checkbox("No binarize (--no-bin)", "--no-bin")
+        self.no_rap_check = _flag_checkbox("No rapify (--no-rap)", "--no-rap")
+        self.no_sign_check = _flag_checkbox("No sign (--no-sign)", "--no-sign")
+        self.no_archive_check = _flag_checkbox("No archive (--no-archive)", "--no-archive")
+
+        _add_widgets(
+            self.main_layout,
+            self.no_bin_check,
+            self.no_rap_check,
+            self.no_sign_check,
+            self.no_archive_check,
+        )
 
         # Verbosity and threads
         self.add_verbosity_section()
         self.add_threads_section()
         self.add_buttons()
 
-    def get_args(self) -> list[str]:
-        """Build argument list from dialog selections."""
-        args = ["release"]
-
-        if self.no_bin_check.isChecked():
-            args.append("--no-bin")
-
-        if self.no_rap_check.isChecked():
-            args.append("--no-rap")
-
-        if self.no_sign_check.isChecked():
-            args.append("--no-sign")
-
-        if self.no_archive_check.isChecked():
-            args.append("--no-archive")
-
-        args.extend(self.get_threads_args())
-        args.extend(self.get_verbosity_args())
-
-        return args
-
 
 class LaunchDialog(BaseCommandDialog):
     """Dialog for 'hemtt launch' command options."""
 
-    def __init__(self, parent, dark_mode: bool = False):
-        super().__init__(parent, "HEMTT Launch Options", dark_mode)
+    _TITLE = "HEMTT Launch Options"
+
+    # Profiles, executable, instances and passthrough args need their own
+    # positions, so get_args is written out and uses these two flag groups
+    _launch_flag_getters = _spec_getters(
+        (
+            ("quick_check", "-Q"),
+            ("no_filepatching_check", "-F"),
+            ("all_optionals_check", "-O"),
+        )
+    )
+    _build_flag_getters = _spec_getters((("binarize_check", "-b"), ("no_rap_check", "--no-rap")))
+
+    def __init__(self, parent):
+        super().__init__(parent)
 
         # Profile/Config
-        profile_layout = QHBoxLayout()
-        profile_label = QLabel("Profile(s):")
         self.profile_entry = QLineEdit()
         self.profile_entry.setPlaceholderText("e.g., default ace +ws (leave empty for default)")
-        profile_layout.addWidget(profile_label)
-        profile_layout.addWidget(self.profile_entry)
-        self.main_layout.addLayout(profile_layout)
+        self.add_form_row("Profile(s):", self.profile_entry)
 
         # Launch options
-        launch_group = QGroupBox("Launch Options")
-        launch_layout = QVBoxLayout()
-
-        self.quick_check = QCheckBox("Quick launch (-Q)")
-        self.quick_check.setToolTip("Skip build step, launch last built version")
+        self.add_section_header("Launch Options")
 
-        self.no_filepatching_check = QCheckBox("No file patching (-F)")
-        self.no_filepatching_check.setToolTip("Disable file patching")
+        self.quick_check = _flag_checkbox("Quick launch (-Q)", "-Q")
+        self.no_filepatching_check = _flag_checkbox("No file patching (-F)", "-F")
 
-        launch_layout.addWidget(self.quick_check)
-        launch_layout.addWidget(self.no_filepatching_check)
-        launch_group.setLayout(launch_layout)
-        self.main_layout.addWidget(launch_group)
+        _add_widgets(self.main_layout, self.quick_check, self.no_filepatching_check)
 
         # Build options for dev
-        build_group = QGroupBox("Dev Build Options")
-        build_layout = QVBoxLayout()
-
-        self.binarize_check = QCheckBox("Binarize (-b)")
-        self.binarize_check.setToolTip("Use BI's binarize on supported files")
+        self.add_section_header("Dev Build Options")
 
-        self.no_rap_check = QCheckBox("No rapify (--no-rap)")
-        self.no_rap_check.setToolTip("Do not rapify files")
+        self.binarize_check = _flag_checkbox("Binarize (-b)", "-b")
+        self.no_rap_check = _flag_checkbox("No rapify (--no-rap)", "--no-rap")
 
-        build_layout.addWidget(self.binarize_check)
-        build_layout.addWidget(self.no_rap_check)
-        build_group.setLayout(build_layout)
-        self.main_layout.addWidget(build_group)
+        _add_widgets(self.main_layout, self.binarize_check, self.no_rap_check)
 
         # Optionals
-        optionals_group = QGroupBox("Optional Addons")
-        optionals_layout = QVBoxLayout()
+        self.add_section_header("Optional Addons")
 
-        self.all_optionals_check = QCheckBox("Include all optionals (-O)")
-        optionals_layout.addWidget(self.all_optionals_check)
+        self.all_optionals_check = _flag_checkbox("Include all optionals (-O)", "-O")
+        self.main_layout.addWidget(self.all_optionals_check)
 
-        specific_layout = QHBoxLayout()
-        specific_label = QLabel("Specific optionals (-o):")
         self.optionals_entry = QLineEdit()
         self.optionals_entry.setPlaceholderText("e.g., caramel chocolate")
-        specific_layout.addWidget(specific_label)
-        specific_layout.addWidget(self.optionals_entry)
-        optionals_layout.addLayout(specific_layout)
-
-        optionals_group.setLayout(optionals_layout)
-        self.main_layout.addWidget(optionals_group)
+        self.add_form_row("Specific optionals (-o):", self.optionals_entry)
 
         # Executable and instances
-        exec_layout = QHBoxLayout()
-        exec_label = QLabel("Executable (-e):")
         self.executable_entry = QLineEdit()
         self.executable_entry.setPlaceholderText("e.g., arma3_x64 or full path")
-        exec_layout.addWidget(exec_label)
-        exec_layout.addWidget(self.executable_entry)
-        self.main_layout.addLayout(exec_layout)
+        self.add_form_row("Executable (-e):", self.executable_entry)
 
-        instances_layout = QHBoxLayout()
-        instances_label = QLabel("Instances (-i):")
         self.instances_spinbox = QSpinBox()
-        self.instances_spinbox.setMinimum(1)
-        self.instances_spinbox.setMaximum(10)
+        self.instances_spinbox.setRange(1, 10)
         self.instances_spinbox.setValue(1)
-        instances_layout.addWidget(instances_label)
-        instances_layout.addWidget(self.instances_spinbox)
-        instances_layout.addStretch()
-        self.main_layout.addLayout(instances_layout)
+        self.add_form_row("Instances (-i):", self.instances_spinbox)
 
         # Passthrough args
-        passthrough_layout = QHBoxLayout()
-        passthrough_label = QLabel("Passthrough args:")
         self.passthrough_entry = QLineEdit()
         self.passthrough_entry.setPlaceholderText("Args after -- (e.g., -world=empty -window)")
-        passthrough_layout.addWidget(passthrough_label)
-        passthrough_layout.addWidget(self.passthrough_entry)
-        self.main_layout.addLayout(passthrough_layout)
+        self.add_form_row("Passthrough args:", self.passthrough_entry)
 
         # Just addons
-        just_layout = QHBoxLayout()
-        just_label = QLabel("Build only (--just):")
         self.just_entry = QLineEdit()
         self.just_entry.setPlaceholderText("e.g., myAddon1 myAddon2")
-        just_layout.addWidget(just_label)
-        just_layout.addWidget(self.just_entry)
-        self.main_layout.addLayout(just_layout)
+        self.add_form_row("Build only (--just):", self.just_entry)
 
         # Verbosity and threads
         self.add_verbosity_section()
@@ -2072,9 +2087,7 @@ class LaunchDialog(BaseCommandDialog):
         args = ["launch"]
 
         # Profile(s) come first
-        profile_text = self.profile_entry.text().strip()
-        if profile_text:
-            args.extend(profile_text.split())
+        args.extend(_split_tokens(self.profile_entry.text()))
 
         # Executable
         executable_text = self.executable_entry.text().strip()
@@ -2086,43 +2099,22 @@ class LaunchDialog(BaseCommandDialog):
         if instances > 1:
             args.extend(["-i", str(instances)])
 
-        # Launch flags
-        if self.quick_check.isChecked():
-            args.append("-Q")
-
-        if self.no_filepatching_check.isChecked():
-            args.append("-F")
-
-        # Optionals
-        if self.all_optionals_check.isChecked():
-            args.append("-O")
-
-        optionals_text = self.optionals_entry.text().strip()
-        if optionals_text:
-            for opt in optionals_text.split():
-                args.extend(["-o", opt])
-
-        # Build options
-        if self.binarize_check.isChecked():
-            args.append("-b")
-
-        if self.no_rap_check.isChecked():
-            args.append("--no-rap")
+        # Launch flags and optionals
+        args.extend(self.get_flag_args(self._launch_flag_getters))
+        args.extend(self.get_repeated_args(self.optionals_entry, "-o"))
 
-        # Just addons
-        just_text = self.just_entry.text().strip()
-        if just_text:
-            for addon in just_text.split():
-                args.extend(["--just", addon])
+        # Build options and just addons
+        args.extend(self.get_flag_args(self._build_flag_getters))
+        args.extend(self.get_repeated_args(self.just_entry, "--just"))
 
         args.extend(self.get_threads_args())
         args.extend(self.get_verbosity_args())
 
         # Passthrough args go last after --
-        passthrough_text = self.passthrough_entry.text().strip()
-        if passthrough_text:
+        passthrough = _split_tokens(self.passthrough_entry.text())
+        if passthrough:
             args.append("--")
-            args.extend(passthrough_text.split())
+            args.extend(passthrough)
 
         return args
 
@@ -2130,18 +2122,15 @@ class LaunchDialog(BaseCommandDialog):
 class LocalizationCoverageDialog(BaseCommandDialog):
     """Dialog for 'hemtt localization coverage' command options."""
 
-    def __init__(self, parent, dark_mode: bool = False):
-        super().__init__(parent, "Localization Coverage Options", dark_mode)
+    _TITLE = "Localization Coverage Options"
+
+    def __init__(self, parent):
+        super().__init__(parent)
 
         # Format selection
-        format_layout = QHBoxLayout()
-        format_label = QLabel("Output format:")
         self.format_combo = QComboBox()
-        self.format_combo.addItems(["ascii", "json", "pretty-json", "markdown"])
-        format_layout.addWidget(format_label)
-        format_layout.addWidget(self.format_combo)
-        format_layout.addStretch()
-        self.main_layout.addLayout(format_layout)
+        self.format_combo.addItems(_OUTPUT_FORMATS)
+        self.add_form_row("Output format:", self.format_combo)
 
         self.add_buttons()
 
@@ -2159,27 +2148,19 @@ class LocalizationCoverageDialog(BaseCommandDialog):
 class LocalizationSortDialog(BaseCommandDialog):
     """Dialog for 'hemtt localization sort' command options."""
 
-    def __init__(self, parent, dark_mode: bool = False):
-        super().__init__(parent, "Localization Sort Options", dark_mode)
+    _TITLE = "Localization Sort Options"
+    _COMMAND = ("localization", "sort")
+    _FLAG_SPEC = (("only_lang_check", "--only-lang"),)
+
+    def __init__(self, parent):
+        super().__init__(parent)
 
         # Options
-        self.only_lang_check = QCheckBox("Only sort languages (--only-lang)")
-        self.only_lang_check.setToolTip(
-            "Only sort the languages within keys, preserve order of packages/containers/keys"
-        )
+        self.only_lang_check = _flag_checkbox("Only sort languages (--only-lang)", "--only-lang")
         self.main_layout.addWidget(self.only_lang_check)
 
         self.add_buttons()
 
-    def get_args(self) -> list[str]:
-        """Build argument list from dialog selections."""
-        args = ["localization", "sort"]
-
-        if self.only_lang_check.isChecked():
-            args.append("--only-lang")
-
-        return args
-
 
 def main() -> None:
     """Entrypoint to start the PySide6 application."""
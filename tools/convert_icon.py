@@ -12,6 +12,11 @@ if not logo_path.exists():
     print(f"Error: {logo_path} not found")
     exit(1)
 
+# Nothing to do if the icon was generated after the last logo change
+if icon_path.exists() and icon_path.stat().st_mtime >= logo_path.stat().st_mtime:
+    print(f"{icon_path} is up to date")
+    exit(0)
+
 # Load the image
 try:
     img = Image.open(logo_path)
@@ -28,8 +33,14 @@ try:
     # Windows uses different sizes in different contexts
     icon_sizes = [(256, 256), (128, 128), (64, 64), (48, 48), (32, 32), (16, 16)]
 
+    # Resample each size from the previous one instead of from the full-size
+    # logo, so only the first step touches every source pixel
+    frames = [img.resize(icon_sizes[0], Image.LANCZOS)]
+    for size in icon_sizes[1:]:
+        frames.append(frames[-1].resize(size, Image.LANCZOS))
+
     # Save as ICO with multiple resolutions for proper Windows display
-    img.save(icon_path, format="ICO", sizes=icon_sizes)
+    frames[0].save(icon_path, format="ICO", sizes=icon_sizes, append_images=frames[1:])
     print(f"Successfully created {icon_path} with multiple resolutions")
     print(f"Sizes included: {', '.join(f'{w}x{h}' for w, h in icon_sizes)}")
 
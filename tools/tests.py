@@ -1,12 +1,37 @@
+import json
 import os
+import queue
 import shlex
+import sys
 import tempfile
+import threading
 import time
 import unittest
-from unittest.mock import MagicMock, patch
+from concurrent import futures
+from typing import ClassVar
+from unittest import mock
+from unittest.mock import patch
 
+import command_runner
 from command_runner import CommandRunner, build_command, strip_ansi_codes
-from config_store import get_config_path, load_config, save_config
+from config_store import DEFAULTS, get_config_path, load_config, save_config
+
+# GUI tests render offscreen so they also run without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+try:
+    import hemtt_gui
+except ImportError:  # PySide6 not installed; the GUI tests are skipped
+    GUI_AVAILABLE = False
+else:
+    GUI_AVAILABLE = True
+
+requires_gui = unittest.skipUnless(GUI_AVAILABLE, "PySide6 is not installed")
+
+
+def _qapplication() -> "hemtt_gui.QApplication":
+    """Return the process-wide QApplication, creating it on first use."""
+    app = hemtt_gui.QApplication.instance()
+    return app if isinstance(app, hemtt_gui.QApplication) else hemtt_gui.QApplication([])
 
 
 class TestCommandRunner(unittest.TestCase):
@@ -32,6 +57,13 @@ class TestCommandRunner(unittest.TestCase):
         cmd = build_command("/usr/local/bin/hemtt", ["version"])
         self.assertEqual(cmd, ["/usr/local/bin/hemtt", "version"])
 
+    def test_build_command_tuple_args(self):
+        """Test command building from a tuple returns a fresh list."""
+        args = ("utils", "fnl")
+        cmd = build_command("hemtt", args)
+        self.assertEqual(cmd, ["hemtt", "utils", "fnl"])
+        self.assertEqual(args, ("utils", "fnl"))
+
     def test_strip_ansi_codes_simple(self):
         """Test ANSI code stripping with basic color codes."""
         text = "\x1b[31mError\x1b[0m"
@@ -47,6 +79,11 @@ class TestCommandRunner(unittest.TestCase):
         text = "Plain text without codes"
         self.assertEqual(strip_ansi_codes(text), text)
 
+    def test_strip_ansi_codes_fastpath_no_alloc(self):
+        """Test that text without an escape byte is returned as the same object."""
+        text = "Building addon main"
+        self.assertIs(strip_ansi_codes(text), text)
+
     def test_strip_ansi_codes_empty(self):
         """Test stripping from empty string."""
         self.assertEqual(strip_ansi_codes(""), "")
@@ -61,10 +98,36 @@ class TestCommandRunner(unittest.TestCase):
         text = "\x1b[2J\x1b[HCleared screen"
         self.assertEqual(strip_ansi_codes(text), "Cleared screen")
 
+    def test_strip_ansi_codes_full_csi(self):
+        """Test CSI sequences with private parameters, intermediates and ~/@ finals."""
+        text = "\x1b[?25l\x1b[>4;1m\x1b[1 q\x1b[2~\x1b[3@Done\x1b[?25h"
+        self.assertEqual(strip_ansi_codes(text), "Done")
+
+    def test_strip_ansi_codes_osc(self):
+        """Test stripping OSC window titles and hyperlinks ended by BEL or ST."""
+        text = "\x1b]0;hemtt\x07\x1b]8;;https://hemtt.dev\x1b\\docs\x1b]8;;\x1b\\"
+        self.assertEqual(strip_ansi_codes(text), "docs")
+
+    def test_strip_ansi_codes_two_byte(self):
+        """Test stripping two-byte escapes such as reset and cursor save/restore."""
+        self.assertEqual(strip_ansi_codes("\x1bc\x1b7Progress\x1b8"), "Progress")
+
 
 class TestCommandRunnerClass(unittest.TestCase):
     """Test CommandRunner class functionality."""
 
+    def _wait_done(self, runner, timeout=5.0):
+        """Block until the runner's pool task (including on_exit) has finished."""
+        done, _ = futures.wait([runner._future], timeout=timeout)
+        self.assertTrue(done)
+
+    def _wait_started(self, runner, timeout=5.0):
+        """Poll until the runner has spawned its process."""
+        deadline = time.monotonic() + timeout
+        while runner.process is None and time.monotonic() < deadline:
+            time.sleep(0.005)
+        self.assertIsNotNone(runner.process)
+
     def test_command_runner_initialization(self):
         """Test CommandRunner initializes with correct state."""
         runner = CommandRunner(
@@ -91,22 +154,64 @@ class TestCommandRunnerClass(unittest.TestCase):
             exit_codes.append(code)
 
         runner = CommandRunner(
-            command=["python", "-c", "print('test')"],
+            command=[sys.executable, "-S", "-c", "print('test')"],
             on_output=on_output,
             on_exit=on_exit,
         )
         runner.start()
-        time.sleep(0.5)  # Give time for process to complete
+        self._wait_done(runner)
 
         self.assertGreater(len(output_lines), 0)
         self.assertEqual(len(exit_codes), 1)
         self.assertEqual(exit_codes[0], 0)
 
+    def test_command_runner_batches_output(self):
+        """Test CommandRunner delivers every line even when batching callbacks."""
+        output_chunks = []
+
+        runner = CommandRunner(
+            command=[sys.executable, "-S", "-c", "print('\\n'.join(str(i) for i in range(50)))"],
+            on_output=lambda text: output_chunks.append(text),
+            on_exit=lambda _: None,
+        )
+        runner.start()
+        self._wait_done(runner)
+
+        lines = "".join(output_chunks).splitlines()
+        self.assertEqual(lines, [str(i) for i in range(50)])
+        self.assertLess(len(output_chunks), 50)
+
+    def _split(self, *chunks):
+        """Feed raw reads through the runner's line splitter, return each emit."""
+        emitted: list[str] = []
+        runner = CommandRunner(command=[], on_output=emitted.append)
+        queued: queue.SimpleQueue[bytes | None] = queue.SimpleQueue()
+        for chunk in (*chunks, None):
+            queued.put(chunk)
+        runner._process(queued)
+        return emitted
+
+    def test_command_runner_line_split_across_reads(self):
+        """Test a line split across two reads is emitted once, whole."""
+        emitted = self._split(b"hel", b"lo\nwor", b"ld\n")
+        self.assertEqual(emitted, ["hello\n", "world\n"])
+
+    def test_command_runner_crlf_output(self):
+        """Test CRLF pairs, even split across reads, give one line break."""
+        emitted = self._split(b"one\r\ntwo\r", b"\nthree\r\n")
+        self.assertEqual("".join(emitted), "one\ntwo\nthree\n")
+
+    def test_command_runner_cr_only_output(self):
+        """Test bare CR progress lines are emitted without waiting for LF."""
+        emitted = self._split(b"10%\r20%\r", b"30%", b"\r", b"done")
+        self.assertEqual(emitted[0], "10%\n")
+        self.assertEqual("".join(emitted), "10%\n20%\n30%\ndone")
+
     def test_command_runner_default_callbacks(self):
         """Test CommandRunner works with no callbacks provided."""
-        runner = CommandRunner(command=["python", "-c", "print('test')"])
+        runner = CommandRunner(command=[sys.executable, "-S", "-c", "print('test')"])
         runner.start()
-        time.sleep(0.5)
+        self._wait_done(runner)
         self.assertFalse(runner.is_running)
 
     def test_command_runner_file_not_found(self):
@@ -120,7 +225,7 @@ class TestCommandRunnerClass(unittest.TestCase):
             on_exit=lambda code: exit_codes.append(code),
         )
         runner.start()
-        time.sleep(0.5)
+        self._wait_done(runner)
 
         self.assertGreater(len(output_lines), 0)
         self.assertIn("Error", output_lines[0])
@@ -135,58 +240,101 @@ class TestCommandRunnerClass(unittest.TestCase):
 
         # Test that NO_COLOR env var is set
         runner = CommandRunner(
-            command=["python", "-c", "import os; print(os.environ.get('NO_COLOR', 'not set'))"],
+            command=[
+                sys.executable,
+                "-S",
+                "-c",
+                "import os; print(os.environ.get('NO_COLOR', 'not set'))",
+            ],
             on_output=on_output,
             on_exit=lambda _: None,
             env=os.environ.copy(),
         )
         runner.start()
-        time.sleep(0.5)
+        self._wait_done(runner)
 
         # Should have NO_COLOR=1 set by the runner
-        self.assertTrue(any("1" in line for line in output_lines))
+        self.assertEqual("".join(output_lines).strip(), "1")
 
     def test_command_runner_cancel(self):
         """Test CommandRunner cancellation."""
         runner = CommandRunner(
-            command=["python", "-c", "import time; time.sleep(10)"],
+            command=[sys.executable, "-S", "-c", "import time; time.sleep(10)"],
             on_output=lambda _: None,
             on_exit=lambda _: None,
         )
         runner.start()
-        time.sleep(0.2)
+        self._wait_started(runner)
         self.assertTrue(runner.is_running)
         runner.cancel()
-        time.sleep(0.5)
+        self._wait_done(runner)
         self.assertFalse(runner.is_running)
 
+    def test_command_runner_cancel_right_after_start(self):
+        """Test a cancel racing process startup still ends the run via on_exit."""
+        exit_codes: list[int] = []
+        runner = CommandRunner(
+            command=[sys.executable, "-S", "-c", "import time; time.sleep(10)"],
+            on_exit=exit_codes.append,
+        )
+        runner.start()
+        runner.cancel()
+        self._wait_done(runner)
+        self.assertEqual(len(exit_codes), 1)
+        self.assertNotEqual(exit_codes[0], 0)
+
+    def test_command_runner_cancel_before_worker_reports_exit(self):
+        """Test cancelling a run still queued for a worker calls on_exit."""
+        exit_codes: list[int] = []
+        runner = CommandRunner(command=["unused"], on_exit=exit_codes.append)
+        with patch.object(command_runner._RUNNER_POOL, "submit", return_value=futures.Future()):
+            runner.start()
+        runner.cancel()
+        self.assertEqual(exit_codes, [1])
+        self.assertIsNone(runner.process)
+
+    def test_runner_pool_uses_daemon_workers(self):
+        """Test pool workers are daemons and an idle worker is reused."""
+        pool = command_runner._DaemonPool("test")
+        seen: list[threading.Thread] = []
+        for _ in range(2):
+            pool.submit(lambda: seen.append(threading.current_thread())).result(timeout=5)
+        self.assertTrue(seen[0].daemon)
+        self.assertIs(seen[0], seen[1])
+
     def test_command_runner_multiple_starts(self):
         """Test that starting an already running runner has no effect."""
         runner = CommandRunner(
-            command=["python", "-c", "import time; time.sleep(1)"],
+            command=[sys.executable, "-S", "-c", "import time; time.sleep(1)"],
             on_output=lambda _: None,
             on_exit=lambda _: None,
         )
         runner.start()
-        time.sleep(0.1)
+        self._wait_started(runner)
         first_process = runner.process
         runner.start()  # Try to start again
         self.assertIs(runner.process, first_process)  # Should be same process
         runner.cancel()
-        time.sleep(0.5)
+        self._wait_done(runner)
 
 
 class TestConfigStore(unittest.TestCase):
     """Test config_store module functions."""
 
-    def setUp(self):
-        """Use an isolated temporary config path for each test."""
-        self._tmpdir = tempfile.TemporaryDirectory()
-        self._config_path = os.path.join(self._tmpdir.name, "config.json")
-        self._config_patcher = patch("config_store.get_config_path", return_value=self._config_path)
-        self._local_patcher = patch(f"{__name__}.get_config_path", return_value=self._config_path)
-        self._config_patcher.start()
-        self._local_patcher.start()
+    _tmpdir: ClassVar[tempfile.TemporaryDirectory[str]]
+    _config_path: ClassVar[str]
+    _config_patcher: ClassVar["mock._patch[mock.MagicMock | mock.AsyncMock]"]
+    _local_patcher: ClassVar["mock._patch[mock.MagicMock | mock.AsyncMock]"]
+
+    @classmethod
+    def setUpClass(cls):
+        """Point config_store at one temporary config path for the whole class."""
+        cls._tmpdir = tempfile.TemporaryDirectory()
+        cls._config_path = os.path.join(cls._tmpdir.name, "config.json")
+        cls._config_patcher = patch("config_store.get_config_path", return_value=cls._config_path)
+        cls._local_patcher = patch(f"{__name__}.get_config_path", return_value=cls._config_path)
+        cls._config_patcher.start()
+        cls._local_patcher.start()
 
     def test_config_roundtrip(self):
         """Test config save and load cycle."""
@@ -206,6 +354,13 @@ class TestConfigStore(unittest.TestCase):
         loaded = load_config()
         self.assertTrue(loaded["dark_mode"])
 
+    def test_config_defaults_not_shared(self):
+        """Test mutating a loaded config's nested defaults leaves DEFAULTS intact."""
+        cfg = load_config()
+        cfg["last_dirs"]["Select PBO file"] = "/tmp"
+        self.assertEqual(DEFAULTS["last_dirs"], {})
+        self.assertEqual(load_config()["last_dirs"], {})
+
     def test_config_defaults(self):
         """Test that config has reasonable defaults."""
         cfg = load_config()
@@ -261,8 +416,6 @@ class TestConfigStore(unittest.TestCase):
 
     def test_config_non_dict_returns_defaults(self):
         """Test that non-dict JSON returns defaults."""
-        import json
-
         path = self._config_path
         # Write non-dict JSON (list instead)
         with open(path, "w", encoding="utf-8") as f:
@@ -281,13 +434,26 @@ class TestConfigStore(unittest.TestCase):
     def test_config_save_creates_file(self):
         """Test save_config creates file if it doesn't exist."""
         path = self._config_path
-        if os.path.exists(path):
-            os.remove(path)
+        # tearDown empties the directory, so the file cannot exist yet
+        self.assertFalse(os.path.exists(path))
 
         cfg = {"hemtt_path": "test"}
         save_config(cfg)
         self.assertTrue(os.path.exists(path))
 
+    def test_config_save_leaves_no_temp_file(self):
+        """Test save_config replaces the config atomically without leftovers."""
+        save_config({"hemtt_path": "first"})
+        save_config({"hemtt_path": "second"})
+        self.assertEqual(load_config()["hemtt_path"], "second")
+        self.assertEqual(os.listdir(self._tmpdir.name), ["config.json"])
+
+    def test_config_roundtrip_without_orjson(self):
+        """Test config persistence falls back to the stdlib json codec."""
+        with patch("config_store.orjson", None):
+            save_config({"hemtt_path": "stdlib"})
+            self.assertEqual(load_config()["hemtt_path"], "stdlib")
+
     def test_config_save_error_handling(self):
         """Test save_config handles errors gracefully."""
         with patch("builtins.open", side_effect=Exception("Write error")):
@@ -314,19 +480,21 @@ class TestConfigStore(unittest.TestCase):
             self.assertIsInstance(key, str)
 
     def tearDown(self):
-        """Stop path patchers and remove temp test data."""
-        self._local_patcher.stop()
-        self._config_patcher.stop()
-        self._tmpdir.cleanup()
+        """Remove files written by the test so the next one starts from defaults."""
+        for name in os.listdir(self._tmpdir.name):
+            os.remove(os.path.join(self._tmpdir.name, name))
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop path patchers and remove the temporary directory."""
+        cls._local_patcher.stop()
+        cls._config_patcher.stop()
+        cls._tmpdir.cleanup()
 
 
 class TestDialogArgumentBuilding(unittest.TestCase):
     """Test command dialog argument building (without GUI)."""
 
-    def setUp(self):
-        """Set up mock dialog attributes for testing."""
-        self.mock_dialog = MagicMock()
-
     def test_check_dialog_arguments_basic(self):
         """Test CheckDialog basic argument building."""
         args = ["check"]
@@ -790,5 +958,291 @@ class TestCommandArgumentValidation(unittest.TestCase):
             shlex.split('launch -- "unterminated', posix=True)
 
 
+@requires_gui
+class TestOutputClassification(unittest.TestCase):
+    """Test severity detection and grouping of command output."""
+
+    def test_severity_level_keywords(self):
+        """Test each severity keyword is detected case-insensitively."""
+        self.assertEqual(hemtt_gui._severity_level("ERROR: missing file"), "error")
+        self.assertEqual(hemtt_gui._severity_level("Warning: unused"), "warning")
+        self.assertEqual(hemtt_gui._severity_level("note: see above"), "info")
+        self.assertIsNone(hemtt_gui._severity_level("Building addon"))
+
+    def test_severity_level_mixed_line(self):
+        """Test the highest severity anywhere in a line wins over earlier keywords."""
+        self.assertEqual(hemtt_gui._severity_level("info: 2 warnings, 1 error"), "error")
+        self.assertEqual(hemtt_gui._severity_level("info: build had a warning"), "warning")
+        self.assertEqual(hemtt_gui._severity_level("failed after warning"), "error")
+        self.assertEqual(hemtt_gui._severity_level("hint: see info"), "info")
+
+    def test_classify_output_groups_runs(self):
+        """Test consecutive lines of one severity share a run and changes split it."""
+        text = "error: a\nerror: b\nplain\nmore plain\nwarning: c\nerror: d\n"
+        self.assertEqual(
+            hemtt_gui._classify_output(text),
+            [
+                ("error", "error: a\nerror: b\n"),
+                (None, "plain\nmore plain\n"),
+                ("warning", "warning: c\n"),
+                ("error", "error: d\n"),
+            ],
+        )
+
+    def test_classify_output_adds_trailing_newline(self):
+        """Test a final line without a newline still ends with one."""
+        self.assertEqual(
+            hemtt_gui._classify_output("plain\nerror: last"),
+            [(None, "plain\n"), ("error", "error: last\n")],
+        )
+        self.assertEqual(hemtt_gui._classify_output(""), [])
+
+
+@requires_gui
+class TestDialogGetArgs(unittest.TestCase):
+    """Test the argument lists built by the real command dialogs."""
+
+    _app: ClassVar["hemtt_gui.QApplication"]
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the QApplication the dialog widgets need."""
+        cls._app = _qapplication()
+
+    def setUp(self):
+        """Pick a thread count that differs from the default so -t is emitted."""
+        self.threads = hemtt_gui._DEFAULT_THREADS % 128 + 1
+
+    def test_dialogs_default_args(self):
+        """Test untouched dialogs emit only their command."""
+        expected = {
+            hemtt_gui.CheckDialog: ["check"],
+            hemtt_gui.DevDialog: ["dev"],
+            hemtt_gui.BuildDialog: ["build"],
+            hemtt_gui.ReleaseDialog: ["release"],
+            hemtt_gui.LaunchDialog: ["launch"],
+            hemtt_gui.LocalizationCoverageDialog: ["localization", "coverage"],
+            hemtt_gui.LocalizationSortDialog: ["localization", "sort"],
+        }
+        for dialog_cls, args in expected.items():
+            with self.subTest(dialog=dialog_cls.__name__):
+                dialog = dialog_cls(None)
+                self.assertEqual(dialog.windowTitle(), dialog_cls._TITLE)
+                self.assertEqual(dialog.get_args(), args)
+
+    def test_check_dialog_args(self):
+        """Test check flags, lints, threads and verbosity in order."""
+        dialog = hemtt_gui.CheckDialog(None)
+        dialog.error_on_all_check.setChecked(True)
+        dialog.pedantic_check.setChecked(True)
+        dialog.lints_entry.setText("s01 s02")
+        assert dialog.threads_spinbox is not None and dialog.verbosity_combo is not None
+        dialog.threads_spinbox.setValue(self.threads)
+        dialog.verbosity_combo.setCurrentIndex(1)
+        self.assertEqual(
+            dialog.get_args(),
+            ["check", "-p", "-e", "-L", "s01", "-L", "s02", "-t", str(self.threads), "-v"],
+        )
+
+    def test_dev_dialog_args(self):
+        """Test dev flags, repeated entries, threads and verbosity in order."""
+        dialog = hemtt_gui.DevDialog(None)
+        dialog.all_optionals_check.setChecked(True)
+        dialog.binarize_check.setChecked(True)
+        dialog.no_rap_check.setChecked(True)
+        dialog.optionals_entry.setText("caramel  chocolate")
+        dialog.just_entry.setText("main")
+        assert dialog.threads_spinbox is not None and dialog.verbosity_combo is not None
+        dialog.threads_spinbox.setValue(self.threads)
+        dialog.verbosity_combo.setCurrentIndex(2)
+        self.assertEqual(
+            dialog.get_args(),
+            [
+                "dev",
+                "-b",
+                "--no-rap",
+                "-O",
+                "-o",
+                "caramel",
+                "-o",
+                "chocolate",
+                "--just",
+                "main",
+                "-t",
+                str(self.threads),
+                "-vv",
+            ],
+        )
+
+    def test_build_and_release_dialog_args(self):
+        """Test build and release flags keep their spec order."""
+        build = hemtt_gui.BuildDialog(None)
+        build.no_rap_check.setChecked(True)
+        build.no_bin_check.setChecked(True)
+        build.just_entry.setText("a b")
+        self.assertEqual(
+            build.get_args(), ["build", "--no-bin", "--no-rap", "--just", "a", "--just", "b"]
+        )
+
+        release = hemtt_gui.ReleaseDialog(None)
+        release.no_archive_check.setChecked(True)
+        release.no_sign_check.setChecked(True)
+        assert release.verbosity_combo is not None
+        release.verbosity_combo.setCurrentIndex(1)
+        self.assertEqual(release.get_args(), ["release", "--no-sign", "--no-archive", "-v"])
+
+    def test_launch_dialog_args(self):
+        """Test launch puts profiles first and passthrough args last after --."""
+        dialog = hemtt_gui.LaunchDialog(None)
+        dialog.profile_entry.setText("default ace")
+        dialog.executable_entry.setText(" arma3_x64 ")
+        dialog.instances_spinbox.setValue(2)
+        dialog.quick_check.setChecked(True)
+        dialog.no_filepatching_check.setChecked(True)
+        dialog.all_optionals_check.setChecked(True)
+        dialog.optionals_entry.setText("caramel")
+        dialog.binarize_check.setChecked(True)
+        dialog.no_rap_check.setChecked(True)
+        dialog.just_entry.setText("main")
+        assert dialog.threads_spinbox is not None and dialog.verbosity_combo is not None
+        dialog.threads_spinbox.setValue(self.threads)
+        dialog.verbosity_combo.setCurrentIndex(1)
+        dialog.passthrough_entry.setText("-world=empty -window")
+        self.assertEqual(
+            dialog.get_args(),
+            [
+                "launch",
+                "default",
+                "ace",
+                "-e",
+                "arma3_x64",
+                "-i",
+                "2",
+                "-Q",
+                "-F",
+                "-O",
+                "-o",
+                "caramel",
+                "-b",
+                "--no-rap",
+                "--just",
+                "main",
+                "-t",
+                str(self.threads),
+                "-v",
+                "--",
+                "-world=empty",
+                "-window",
+            ],
+        )
+
+    def test_localization_dialog_args(self):
+        """Test localization coverage format and sort flag."""
+        coverage = hemtt_gui.LocalizationCoverageDialog(None)
+        coverage.format_combo.setCurrentText("json")
+        self.assertEqual(coverage.get_args(), ["localization", "coverage", "--format", "json"])
+
+        sort = hemtt_gui.LocalizationSortDialog(None)
+        sort.only_lang_check.setChecked(True)
+        self.assertEqual(sort.get_args(), ["localization", "sort", "--only-lang"])
+
+
+@requires_gui
+class TestMainWindow(unittest.TestCase):
+    """Test main window signal and event handling."""
+
+    _app: ClassVar["hemtt_gui.QApplication"]
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the QApplication the window needs."""
+        cls._app = _qapplication()
+
+    def setUp(self):
+        """Build a window whose config lives in a temporary directory."""
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        config_path = os.path.join(tmpdir.name, "config.json")
+        patcher = patch("config_store.get_config_path", return_value=config_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.window = hemtt_gui.HemttGUI()
+        self.addCleanup(self.window.deleteLater)
+
+    def test_command_finished_large_exit_code(self):
+        """Test exit codes above 2**31 (e.g. winget HRESULTs) reach the log intact."""
+        code = 0x8A15002B
+        # Emitted from a worker thread, as the runner does, so it goes through Qt's queue
+        emitter = threading.Thread(target=self.window.command_finished.emit, args=(code,))
+        emitter.start()
+        emitter.join()
+        self._app.processEvents()
+        self.assertIn(f"[Process exited with code {code}]", self.window.output.toPlainText())
+
+    def _drop(self, path: str) -> None:
+        """Deliver a drop of ``path`` to the window."""
+        from PySide6.QtCore import QMimeData, QPointF, Qt, QUrl
+
+        mime = QMimeData()
+        mime.setUrls([QUrl.fromLocalFile(path)])
+        event = hemtt_gui.QDropEvent(
+            QPointF(0, 0),
+            Qt.DropAction.CopyAction,
+            mime,
+            Qt.MouseButton.LeftButton,
+            Qt.KeyboardModifier.NoModifier,
+        )
+        self.window.dropEvent(event)
+
+    def test_drop_current_project_is_ignored(self):
+        """Test re-dropping the project with another spelling keeps the entry as is."""
+        with tempfile.TemporaryDirectory() as project:
+            self.window.proj_entry.setText(project)
+            with patch.object(self.window, "_persist_config") as persist:
+                self._drop(project + os.sep)
+                self._drop(os.path.join(project, ".", ""))
+            persist.assert_not_called()
+            self.assertEqual(self.window.proj_entry.text(), project)
+
+    def test_file_dialogs_share_cache_and_last_folder(self):
+        """Test utility and browse dialogs are reused and reopen where last used."""
+        dialog_cls = hemtt_gui.QFileDialog
+        with tempfile.TemporaryDirectory() as folder:
+            chosen = os.path.join(folder, "arma3_x64.exe")
+            with (
+                patch.object(dialog_cls, "exec", return_value=1),
+                patch.object(dialog_cls, "selectedFiles", return_value=[chosen]),
+            ):
+                self.assertEqual(self.window._open_file("Select PBO file", "PBO (*.pbo)"), chosen)
+                first = self.window._file_dialogs["Select PBO file"]
+                self.window._open_file("Select PBO file", "PBO (*.pbo)")
+                self.window.arma3_entry.clear()
+                self.window._browse_arma3()
+                self.window._browse_arma3()
+            self.assertIs(self.window._file_dialogs["Select PBO file"], first)
+            self.assertEqual(self.window._last_dirs["Select PBO file"], folder)
+            self.assertEqual(self.window._last_dirs["Select Arma 3 executable"], folder)
+            browse = self.window._file_dialogs["Select Arma 3 executable"]
+            self.assertEqual(os.path.normpath(browse.directory().absolutePath()), folder)
+
+    def test_save_dialog_uses_save_mode(self):
+        """Test output-file dialogs go through the shared helper in save mode."""
+        dialog_cls = hemtt_gui.QFileDialog
+        with patch.object(dialog_cls, "exec", return_value=0):
+            self.assertEqual(self.window._save_file("Select JSON output", "JSON (*.json)"), "")
+        dialog = self.window._file_dialogs["Select JSON output"]
+        self.assertEqual(dialog.acceptMode(), dialog_cls.AcceptMode.AcceptSave)
+
+    def test_drop_new_project_updates_entry(self):
+        """Test dropping a different folder sets it as the project directory."""
+        with tempfile.TemporaryDirectory() as project:
+            with patch.object(self.window, "_persist_config") as persist:
+                self._drop(project)
+            persist.assert_called_once()
+            self.assertEqual(
+                hemtt_gui._path_key(self.window.proj_entry.text()), hemtt_gui._path_key(project)
+            )
+
+
 if __name__ == "__main__":
     unittest.main()